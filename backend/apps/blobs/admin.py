@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import Blob
+
+
+@admin.register(Blob)
+class BlobAdmin(admin.ModelAdmin):
+    list_display = ("name", "size", "refs", "last_stored_at")
+    list_filter = ("last_stored_at",)
+    search_fields = ("name",)
+    readonly_fields = ("name", "size", "refs", "created_at", "last_stored_at")
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.blobs.models import Blob
+from apps.blobs.storage import BLOB_DIR, blob_storage
+from apps.resources.models import Resource
+from apps.users.models import Profile
+
+
+# Every file field stored in blob_storage; --recount rebuilds refs from these.
+REFERENCES = ((Resource, "file"), (Profile, "avatar"))
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete content-addressed files that no row references any more. Blobs stored within the last "
+        "--grace-hours are kept, since the row that will reference them may not be saved yet."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--grace-hours", type=int, default=24)
+        parser.add_argument("--recount", action="store_true", help="Rebuild reference counts from the models first.")
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        if options["grace_hours"] < 0:
+            raise CommandError("--grace-hours cannot be negative.")
+        if options["recount"] and not options["dry_run"]:
+            self._recount()
+
+        orphans = Blob.objects.filter(
+            refs__lte=0, last_stored_at__lt=timezone.now() - timedelta(hours=options["grace_hours"])
+        )
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"Would remove {orphans.count()} blobs."))
+            return
+
+        removed = freed = 0
+        for blob in orphans.iterator():
+            # Re-check in the delete itself so a blob re-stored meanwhile survives.
+            # The file goes before the delete commits: a concurrent save of the
+            # same content blocks on writing its row until then, so it finds the
+            # file missing and writes it again instead of pointing at a purged one.
+            with transaction.atomic():
+                deleted, _ = Blob.objects.filter(pk=blob.pk, refs__lte=0, last_stored_at=blob.last_stored_at).delete()
+                if deleted:
+                    blob_storage.purge(blob.name)
+            if deleted:
+                removed += 1
+                freed += blob.size
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} blobs ({freed} bytes)."))
+
+    def _recount(self):
+        counts = {}
+        for model, field_name in REFERENCES:
+            rows = model.objects.filter(**{f"{field_name}__startswith": BLOB_DIR + "/"}).values(field_name).annotate(n=Count("pk"))
+            for row in rows.order_by():
+                counts[row[field_name]] = counts.get(row[field_name], 0) + row["n"]
+
+        changed = []
+        for blob in Blob.objects.only("pk", "name", "refs").iterator():
+            refs = counts.get(blob.name, 0)
+            if blob.refs != refs:
+                blob.refs = refs
+                changed.append(blob)
+        Blob.objects.bulk_update(changed, ["refs"], batch_size=500)
+        self.stdout.write(f"Corrected {len(changed)} reference counts.")
@@ -0,0 +1,81 @@
+from django.db import models
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save
+from django.utils import timezone
+
+
+class Blob(models.Model):
+    """One content-addressed file and the number of model fields pointing at it.
+
+    Rows are created by :class:`~apps.blobs.storage.ContentAddressedStorage`
+    with no references; the model signals wired up by :func:`track_blobs` add
+    and drop references, and ``collect_blobs`` deletes files left at zero.
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField()
+    refs = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped on every save of the content so a fresh upload is never collected
+    # before the model that stores it has been saved.
+    last_stored_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [models.Index(fields=["refs", "last_stored_at"], name="blob_orphan_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.refs} refs)"
+
+
+def retain(name: str | None) -> None:
+    if name:
+        Blob.objects.filter(name=name).update(refs=F("refs") + 1)
+
+
+def release(name: str | None) -> None:
+    if name:
+        Blob.objects.filter(name=name).update(refs=F("refs") - 1)
+
+
+def _stored_name(instance, attname: str):
+    # Read the raw attribute so deferred fields are not loaded just to track them.
+    value = instance.__dict__.get(attname, ...)
+    return value if value is ... or value is None or isinstance(value, str) else value.name
+
+
+def track_blobs(model, *field_names: str) -> None:
+    """Keep blob reference counts in step with ``model``'s file fields.
+
+    Names that are not blobs (files stored before the content-addressed
+    storage, or on another storage) match no row and are left alone.
+    """
+
+    attnames = [model._meta.get_field(field_name).attname for field_name in field_names]
+
+    def remember(sender, instance, **kwargs):
+        instance._blob_names = {attname: _stored_name(instance, attname) for attname in attnames}
+
+    def saved(sender, instance, created, raw=False, **kwargs):
+        if raw:
+            return
+        previous = getattr(instance, "_blob_names", {})
+        for attname in attnames:
+            old, new = previous.get(attname, ...), _stored_name(instance, attname)
+            if new is ... or (old == new and not created):
+                continue
+            retain(new)
+            # An unknown previous value (deferred at load) is never released.
+            if old is not ... and not created:
+                release(old)
+        remember(sender, instance)
+
+    def deleted(sender, instance, **kwargs):
+        for attname in attnames:
+            name = _stored_name(instance, attname)
+            if name is not ...:
+                release(name)
+
+    uid = f"blobs:{model._meta.label}"
+    post_init.connect(remember, sender=model, weak=False, dispatch_uid=uid)
+    post_save.connect(saved, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(deleted, sender=model, weak=False, dispatch_uid=uid)
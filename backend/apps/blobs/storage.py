@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import tempfile
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+
+BLOB_DIR = "blobs"
+# Files derived from a blob (avatar renditions) live in this folder beside it,
+# named ``<digest>-...``, and are deleted together with it.
+DERIVED_DIR = "renditions"
+
+
+def is_blob(name: str | None) -> bool:
+    return bool(name) and name.startswith(BLOB_DIR + "/")
+
+
+def content_digest(content) -> str:
+    # Reuse a digest computed while the file arrived (chunked uploads) when there is one.
+    digest = getattr(content, "sha256", None)
+    if digest:
+        return digest
+    hasher = hashlib.sha256()
+    for chunk in content.chunks():
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """Stores each distinct file once, under ``blobs/ab/cd/<sha256><ext>``.
+
+    The name the model asked for only contributes its extension, so the same
+    bytes uploaded twice resolve to the same name and the second save writes
+    nothing. ``delete`` is a no-op: several rows may share a file, so files are
+    removed by ``collect_blobs`` once their :class:`~apps.blobs.models.Blob`
+    reference count has dropped to zero.
+    """
+
+    def blob_name(self, digest: str, name: str) -> str:
+        extension = os.path.splitext(name)[1].lower()
+        return posixpath.join(BLOB_DIR, digest[:2], digest[2:4], digest + extension)
+
+    def get_available_name(self, name, max_length=None):
+        return name
+
+    def _save(self, name, content):
+        from .models import Blob
+
+        name = self.blob_name(content_digest(content), name)
+        # The row is written before the file is looked for. collect_blobs purges
+        # inside the transaction that deletes the row, so this write waits until
+        # the file is gone; it starts with an UPDATE rather than a read so that
+        # SQLite waits for the lock too instead of failing as busy.
+        fields = {"size": content.size, "last_stored_at": timezone.now()}
+        if not Blob.objects.filter(name=name).update(**fields):
+            try:
+                with transaction.atomic():
+                    Blob.objects.create(name=name, **fields)
+            except IntegrityError:
+                Blob.objects.filter(name=name).update(**fields)
+
+        path = self.path(name)
+        if not os.path.exists(path):
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            if hasattr(content, "temporary_file_path"):
+                file_move_safe(content.temporary_file_path(), path, allow_overwrite=True)
+            else:
+                # Write beside the target and rename, so a concurrent save of
+                # the same content never sees a half-written file.
+                with tempfile.NamedTemporaryFile(dir=directory, delete=False) as handle:
+                    for chunk in content.chunks():
+                        handle.write(chunk)
+                os.replace(handle.name, path)
+            if self.file_permissions_mode is not None:
+                os.chmod(path, self.file_permissions_mode)
+        return name
+
+    def delete(self, name):
+        pass
+
+    def purge(self, name: str) -> None:
+        """Really delete a blob and everything derived from it."""
+
+        super().delete(name)
+        directory, filename = posixpath.split(name)
+        derived = posixpath.join(directory, DERIVED_DIR)
+        stem = os.path.splitext(filename)[0] + "-"
+        if self.exists(derived):
+            for entry in self.listdir(derived)[1]:
+                if entry.startswith(stem):
+                    super().delete(posixpath.join(derived, entry))
+
+
+blob_storage = ContentAddressedStorage()
+
+
+def get_blob_storage() -> ContentAddressedStorage:
+    return blob_storage
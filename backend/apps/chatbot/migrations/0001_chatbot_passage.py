@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+CREATE_TABLE = """
+CREATE VIRTUAL TABLE chatbot_passage USING fts5(
+    text,
+    title UNINDEXED,
+    kind UNINDEXED,
+    source_id UNINDEXED,
+    course_id UNINDEXED,
+    owner_id UNINDEXED,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+)
+"""
+
+
+class Migration(migrations.Migration):
+    """Creates the empty passage index; ``build_chatbot_index`` fills it."""
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.RunSQL(CREATE_TABLE, "DROP TABLE chatbot_passage"),
+    ]
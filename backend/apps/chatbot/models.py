@@ -0,0 +1,9 @@
+from apps.courses.models import Lesson
+from apps.resources.models import Resource
+from apps.search.fts import keep_indexed
+
+from .retrieval import index_source, remove_source
+
+
+# The passage index is the FTS5 table created in migrations; it has no Django model.
+keep_indexed((Lesson, Resource), index_source, remove_source)
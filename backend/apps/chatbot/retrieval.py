@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import re
+
+from django.db import connection
+
+from apps.search.fts import FTSTable, quoted, terms
+
+
+TABLE = "chatbot_passage"
+LESSON = "lesson"
+RESOURCE = "resource"
+KIND_CODES = {LESSON: 1, RESOURCE: 2}
+# Each source owns the rowid block [base, base + MAX_PASSAGES), so re-indexing
+# one lesson is a rowid range delete instead of a scan of the whole table.
+MAX_PASSAGES = 1024
+PASSAGE_WORDS = 80
+
+MAX_TERMS = 16
+# A passage is only an answer if it matches this share of the question's
+# content words; OR matching alone lets one shared word ("welcome") win.
+# Matches are counted by FTS5 itself, so they follow the index's stemming.
+MIN_TERM_SHARE = 0.6
+CANDIDATES = 4
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+STOPWORDS = frozenset(
+    "a about an and any are as at be by can do does explain explains for from get how i in is it know learn me "
+    "my of on or please say says should so take tell that the there this to want was what when where which who "
+    "why will with you your".split()
+)
+
+table = FTSTable(TABLE, ("text", "title", "kind", "source_id", "course_id", "owner_id"))
+
+
+def _base(kind: str, pk: int) -> int:
+    return (pk * len(KIND_CODES) + KIND_CODES[kind] - 1) * MAX_PASSAGES
+
+
+def split_passages(text: str, size: int = PASSAGE_WORDS) -> list[str]:
+    """Pack whole sentences into passages of about ``size`` words."""
+
+    passages, current, words = [], [], 0
+    for sentence in SENTENCE_END.split(text or ""):
+        sentence = " ".join(sentence.split())
+        if not sentence:
+            continue
+        count = len(sentence.split())
+        if current and words + count > size:
+            passages.append(" ".join(current))
+            current, words = [], 0
+        current.append(sentence)
+        words += count
+    if current:
+        passages.append(" ".join(current))
+    return passages[:MAX_PASSAGES]
+
+
+def source(instance) -> tuple[str, dict] | None:
+    from apps.courses.models import Lesson
+    from apps.resources.models import Resource
+
+    if isinstance(instance, Lesson):
+        return LESSON, {"title": instance.title, "text": instance.content, "course_id": instance.course_id}
+    if isinstance(instance, Resource):
+        return RESOURCE, {"title": instance.title, "text": instance.description, "owner_id": instance.created_by_id}
+    return None
+
+
+def _rows(kind: str, pk: int, fields: dict) -> list[tuple]:
+    base = _base(kind, pk)
+    return [
+        (base + position, text, fields["title"], kind, pk, fields.get("course_id"), fields.get("owner_id"))
+        for position, text in enumerate(split_passages(fields["text"]))
+    ]
+
+
+def index_source(instance) -> None:
+    kind, fields = source(instance)
+    base = _base(kind, instance.pk)
+    table.replace(base, base + MAX_PASSAGES, _rows(kind, instance.pk, fields))
+
+
+def remove_source(instance) -> None:
+    kind, _ = source(instance)
+    base = _base(kind, instance.pk)
+    table.delete(base, base + MAX_PASSAGES)
+
+
+def _all_rows(batch_size: int):
+    from apps.courses.models import Lesson
+    from apps.resources.models import Resource
+
+    querysets = (
+        Lesson.objects.only("pk", "title", "content", "course_id"),
+        Resource.objects.only("pk", "title", "description", "created_by_id"),
+    )
+    for queryset in querysets:
+        for instance in queryset.order_by().iterator(chunk_size=batch_size):
+            kind, fields = source(instance)
+            yield from _rows(kind, instance.pk, fields)
+
+
+def rebuild(batch_size: int = 500) -> int:
+    """Split every lesson and resource into passages and index them from scratch."""
+
+    return table.rebuild(_all_rows(batch_size), batch_size)
+
+
+def match_expression(question: str) -> str | None:
+    """Any of the question's content words; BM25 ranks passages matching more and rarer ones first."""
+
+    words = terms(question, MAX_TERMS, STOPWORDS)
+    if not words:
+        return None
+    return " OR ".join(quoted(term) for term in words)
+
+
+def _matched_terms(words: list[str], passage_ids: list[int]) -> dict[int, int]:
+    """How many of ``words`` each of ``passage_ids`` matches, one MATCH per word."""
+
+    if not passage_ids:
+        return {}
+    placeholders = ", ".join(["%s"] * len(passage_ids))
+    branch = f"SELECT rowid FROM {TABLE} WHERE {TABLE} MATCH %s AND rowid IN ({placeholders})"
+    sql = f"SELECT rowid, COUNT(*) FROM ({' UNION ALL '.join([branch] * len(words))}) GROUP BY rowid"
+    params = []
+    for word in words:
+        params += [quoted(word), *passage_ids]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return dict(cursor.fetchall())
+
+
+def retrieve(question: str, user_id: int | None = None, limit: int = 3) -> list[dict]:
+    """Top passages for ``question`` that cover enough of its words; resources are only searched for their owner."""
+
+    words = terms(question, MAX_TERMS, STOPWORDS)
+    expression = match_expression(question)
+    if expression is None:
+        return []
+
+    sql = f"""
+        SELECT rowid, text, title, kind, source_id, course_id, rank
+        FROM {TABLE}
+        WHERE {TABLE} MATCH %s AND (owner_id IS NULL OR owner_id = %s)
+        ORDER BY rank
+        LIMIT %s
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [expression, user_id, limit * CANDIDATES])
+        rows = cursor.fetchall()
+
+    matched = _matched_terms(words, [row[0] for row in rows])
+    passages = []
+    for passage_id, text, title, kind, source_id, course_id, rank in rows:
+        if matched.get(passage_id, 0) < MIN_TERM_SHARE * len(words):
+            continue
+        passages.append(
+            {"text": text, "title": title, "kind": kind, "id": source_id, "course_id": course_id, "score": round(-rank, 4)}
+        )
+        if len(passages) == limit:
+            break
+    return passages
@@ -0,0 +1,50 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.courses.models import Course, Lesson
+
+from .retrieval import retrieve
+
+
+GREETING = "Hi — I am the MngFX helper. Ask me about course content, indicators, or market data."
+COURSES = "You can view available courses at /api/courses/. Which level do you want? beginner/intermediate/advanced?"
+
+
+class QueryBotTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = get_user_model().objects.create_user("author", "author@example.com", "pw")
+        course = Course.objects.create(title="Foundations", created_by=user)
+        Lesson.objects.create(course=course, title="Intro", content="Welcome to the course. We start with charts.")
+        Lesson.objects.create(
+            course=course,
+            title="Risk",
+            content="Stop rules: place stops beyond the swing low. Stops protect the account when a zone fails.",
+        )
+
+    def ask(self, message: str) -> dict:
+        return APIClient().post("/api/chatbot/query/", {"message": message}, format="json").data
+
+    def test_bare_greeting_and_course_request_get_canned_replies(self):
+        self.assertEqual(self.ask("Hello!")["reply"], GREETING)
+        self.assertEqual(self.ask("courses?")["reply"], COURSES)
+
+    def test_one_shared_word_does_not_answer(self):
+        self.assertEqual(self.ask("Which course should I take?")["reply"], COURSES)
+        self.assertEqual(self.ask("hello, welcome")["reply"], GREETING)
+
+    def test_greeting_with_a_question_is_answered_from_lessons(self):
+        data = self.ask("hey, how do I place stops")
+        self.assertEqual(data["sources"][0]["title"], "Risk")
+
+    def test_course_word_with_a_question_is_answered_from_lessons(self):
+        data = self.ask("which lesson explains stops?")
+        self.assertEqual(data["sources"][0]["title"], "Risk")
+
+    def test_inflected_terms_pass_the_relevance_gate(self):
+        self.assertEqual(self.ask("stopping rules")["sources"][0]["title"], "Risk")
+        self.assertEqual(retrieve("zone stopping")[0]["title"], "Risk")
+
+    def test_unrelated_question_falls_back(self):
+        self.assertNotIn("sources", self.ask("fibonacci retracement levels"))
@@ -2,6 +2,10 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from apps.search.fts import TERM_PATTERN
+
+from .retrieval import STOPWORDS, retrieve
+
 
 FOREX_SPECIAL_SNIPPET = (
     "Today Forex Special (Supply & Demand + Liquidity) playbook highlights: focus on London/NY overlap, draw higher "
@@ -9,6 +13,12 @@ FOREX_SPECIAL_SNIPPET = (
     "and avoid holding through major news without a plan. View the full interactive guide inside the app under Today FX "
     "Special or visit /today-forex-special to cycle through all cards."
 )
+GREETINGS = frozenset({"hello", "hi", "hey", "welcome"})
+COURSE_WORDS = frozenset({"course", "courses", "lesson", "lessons"})
+
+
+def _cite(passage: dict) -> str:
+    return f'{passage["text"]}\n\n(From the {passage["kind"]} "{passage["title"]}".)'
 
 
 @api_view(["POST"])
@@ -18,14 +28,25 @@ def query_bot(request):
     if not text:
         return Response({"reply": "Please send a question."})
 
+    # Greeting and course words say what the user wants, not what about, so
+    # they are left out of the lookup; a message made only of them gets its
+    # fixed reply, and anything else falls back to it when nothing matches.
+    words = [word for word in TERM_PATTERN.findall(text) if word not in STOPWORDS]
+    topic = [word for word in words if word not in GREETINGS | COURSE_WORDS]
+    if topic:
+        user_id = request.user.pk if request.user.is_authenticated else None
+        passages = retrieve(" ".join(topic), user_id=user_id)
+        if passages:
+            return Response({"reply": _cite(passages[0]), "sources": passages})
+
     if "today forex" in text or "supply" in text or "liquidity" in text or "demand" in text:
         reply = FOREX_SPECIAL_SNIPPET
-    elif "course" in text or "lesson" in text:
+    elif COURSE_WORDS.intersection(words):
         reply = "You can view available courses at /api/courses/. Which level do you want? beginner/intermediate/advanced?"
-    elif any(greeting in text for greeting in ("hello", "hi")):
+    elif GREETINGS.intersection(words):
         reply = "Hi — I am the MngFX helper. Ask me about course content, indicators, or market data."
     else:
-        reply = f"[bot placeholder] I got: {text}. Soon I will query course content and docs."
+        reply = "I could not find that in the course material yet. Try naming a lesson topic, or browse /api/courses/."
 
     return Response({"reply": reply})
 
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+
+CATALOGUE_VERSION_ROW = 1
+CATALOGUE_RESPONSE_KEY = "courses:catalogue:{version}:{digest}"
+CATALOGUE_RESPONSE_TIMEOUT = 60 * 60
+
+
+def catalogue_version() -> int:
+    """Nanosecond timestamp of the last catalogue change, doubling as its version.
+
+    It lives in the database rather than the cache: with a per-process cache a
+    write in one worker would leave the others serving new content under the
+    old version and ETag. Reading it is one primary-key lookup.
+    """
+
+    from .models import CatalogueVersion
+
+    version = CatalogueVersion.objects.filter(pk=CATALOGUE_VERSION_ROW).values_list("version", flat=True).first()
+    if version is None:
+        version = bump_catalogue_version()
+    return version
+
+
+def bump_catalogue_version(**kwargs) -> int:
+    from .models import CatalogueVersion
+
+    version = time.time_ns()
+    CatalogueVersion.objects.update_or_create(pk=CATALOGUE_VERSION_ROW, defaults={"version": version})
+    return version
+
+
+class CachedCatalogueMixin:
+    """Caches serialized ``list``/``retrieve`` data under the current catalogue version.
+
+    Old versions are never deleted, they just stop being read and expire. Every
+    response carries an ETag and Last-Modified derived from the version, and
+    matching conditional requests get a 304 before the catalogue is queried.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(request, super().retrieve, *args, **kwargs)
+
+    def _cached_response(self, request, handler, *args, **kwargs):
+        version = catalogue_version()
+        digest = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        etag = quote_etag(f"{version:x}-{digest[:12]}")
+        last_modified = version // 1_000_000_000
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            key = CATALOGUE_RESPONSE_KEY.format(version=version, digest=digest)
+            data = cache.get(key)
+            if data is not None:
+                response = Response(data)
+            else:
+                response = handler(request, *args, **kwargs)
+                if response.status_code == 200:
+                    cache.set(key, response.data, CATALOGUE_RESPONSE_TIMEOUT)
+
+        if 200 <= response.status_code < 400:
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+            patch_vary_headers(response, ["Accept"])
+        return response
@@ -1,7 +1,11 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.text import slugify
 
+from .cache import bump_catalogue_version
+
 
 class Course(models.Model):
     title = models.CharField(max_length=255)
@@ -10,6 +14,9 @@ class Course(models.Model):
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["-created_at", "-id"], name="course_created_idx")]
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
@@ -32,3 +39,17 @@ class Lesson(models.Model):
     def __str__(self) -> str:
         return f"{self.course.title} - {self.title}"
 
+
+class CatalogueVersion(models.Model):
+    """Single row holding the catalogue version, so every process reads the same one (see ``cache.py``)."""
+
+    version = models.BigIntegerField()
+
+    def __str__(self) -> str:
+        return f"Catalogue version {self.version}"
+
+
+@receiver([post_save, post_delete], sender=Course)
+@receiver([post_save, post_delete], sender=Lesson)
+def invalidate_catalogue(sender, **kwargs):
+    bump_catalogue_version()
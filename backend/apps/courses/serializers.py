@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from mngfx_backend.serializers import SparseFieldsetMixin
+
 from .models import Course, Lesson
 
 
@@ -9,10 +11,26 @@ class LessonSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "content", "video_url", "order"]
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class LessonSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Lesson
+        fields = ["id", "title", "order"]
+
+
+class CourseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     lessons = LessonSerializer(many=True, read_only=True)
 
     class Meta:
         model = Course
         fields = ["id", "title", "slug", "description", "lessons", "created_at"]
 
+
+class CourseListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """Catalogue entry: lesson titles and order only, full lessons come from the detail route."""
+
+    lesson_count = serializers.IntegerField(read_only=True)
+    lessons = LessonSummarySerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Course
+        fields = ["id", "title", "slug", "description", "lesson_count", "lessons", "created_at"]
@@ -1,11 +1,26 @@
+from django.db.models import Count, Prefetch
 from rest_framework import permissions, viewsets
 
-from .models import Course
-from .serializers import CourseSerializer
+from .cache import CachedCatalogueMixin
+from .models import Course, Lesson
+from .serializers import CourseListSerializer, CourseSerializer
 
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(CachedCatalogueMixin, viewsets.ModelViewSet):
     queryset = Course.objects.all().order_by("-created_at")
     serializer_class = CourseSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        # Lessons come from a single prefetch query, so list and detail cost two
+        # queries however many courses and lessons there are.
+        qs = super().get_queryset()
+        if self.action == "list":
+            lessons = Lesson.objects.only("id", "course_id", "title", "order")
+            return qs.annotate(lesson_count=Count("lessons")).prefetch_related(Prefetch("lessons", queryset=lessons))
+        return qs.prefetch_related("lessons")
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return CourseListSerializer
+        return super().get_serializer_class()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+EXPORT_FIELDS = ["id", "created_at", "name", "email", "phone", "subject", "message", "rating", "handled", "user_id"]
+EXPORT_CHUNK_SIZE = 2000
+LINES_PER_CHUNK = 500
+CSV = "csv"
+NDJSON = "ndjson"
+EXPORT_FORMATS = {CSV: "text/csv", NDJSON: "application/x-ndjson"}
+
+# Leading characters spreadsheets evaluate as formulas.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def _cell(value):
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _rows(queryset):
+    # ``iterator`` streams rows in chunks (a server-side cursor where supported)
+    # instead of caching the whole result on the queryset.
+    return queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def _buffered(lines):
+    # One write per row is a lot of tiny chunks on the wire; send a few hundred at a time.
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= LINES_PER_CHUNK:
+            yield "".join(buffer)
+            buffer.clear()
+    if buffer:
+        yield "".join(buffer)
+
+
+def csv_lines(queryset):
+    writer = csv.writer(_Echo())
+    lines = (writer.writerow([_cell(value) for value in row]) for row in _rows(queryset))
+    yield writer.writerow(EXPORT_FIELDS)
+    yield from _buffered(lines)
+
+
+def ndjson_lines(queryset):
+    encoder = DjangoJSONEncoder()
+    yield from _buffered(encoder.encode(dict(zip(EXPORT_FIELDS, row))) + "\n" for row in _rows(queryset))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+
+TRUE_VALUES = {"1", "true", "yes"}
+FALSE_VALUES = {"0", "false", "no"}
+
+
+def _parse_bound(raw: str, name: str, end: bool = False) -> datetime:
+    parsed = parse_datetime(raw)
+    if parsed is None:
+        day = parse_date(raw)
+        if day is None:
+            raise ValidationError({name: "Use an ISO 8601 date or datetime."})
+        # A bare ``to`` date includes that whole day.
+        parsed = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def filter_feedback(queryset, params):
+    """Apply the ``handled``, ``rating`` and ``from``/``to`` query filters.
+
+    ``rating`` takes a comma separated list (``none`` matches unrated messages);
+    ``to`` is exclusive for datetimes and inclusive for plain dates.
+    """
+
+    handled = (params.get("handled") or "").strip().lower()
+    if handled in TRUE_VALUES:
+        queryset = queryset.filter(handled=True)
+    elif handled in FALSE_VALUES:
+        queryset = queryset.filter(handled=False)
+    elif handled:
+        raise ValidationError({"handled": "Use true or false."})
+
+    rating = (params.get("rating") or "").strip().lower()
+    if rating:
+        values = {value.strip() for value in rating.split(",") if value.strip()}
+        condition = Q(rating__isnull=True) if "none" in values else Q()
+        values.discard("none")
+        if not all(value.isdigit() for value in values):
+            raise ValidationError({"rating": "Use comma separated ratings or none."})
+        if values:
+            condition |= Q(rating__in=[int(value) for value in values])
+        queryset = queryset.filter(condition)
+
+    if params.get("from"):
+        queryset = queryset.filter(created_at__gte=_parse_bound(params["from"], "from"))
+    if params.get("to"):
+        queryset = queryset.filter(created_at__lt=_parse_bound(params["to"], "to", end=True))
+    return queryset
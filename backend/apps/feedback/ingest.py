@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.db import close_old_connections
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 200
+FLUSH_INTERVAL = 0.5
+MAX_PENDING = 10_000
+
+
+class FeedbackBuffer:
+    """Write-behind queue for validated feedback submissions.
+
+    Requests enqueue plain field dicts and return; one daemon thread per process
+    inserts them with ``bulk_create`` every ``interval`` seconds or ``batch_size``
+    rows, so a burst takes the database write lock once per batch instead of once
+    per submission. Pending rows live in memory and are flushed at interpreter
+    exit, but a hard crash loses them.
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE, interval: float = FLUSH_INTERVAL, max_pending: int = MAX_PENDING):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, row: dict) -> bool:
+        """Queue one submission; ``False`` when the buffer is full and the caller should write directly."""
+
+        self._ensure_worker()
+        try:
+            self.queue.put_nowait(row)
+        except queue.Full:
+            return False
+        return True
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="feedback-write-behind", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            rows = [self.queue.get()]
+            deadline = time.monotonic() + self.interval
+            while len(rows) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.flush(rows)
+
+    def drain(self) -> None:
+        rows = []
+        while True:
+            try:
+                rows.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        if rows:
+            self.flush(rows)
+
+    def flush(self, rows: list[dict]) -> None:
+        from .models import FeedbackMessage
+        from .summary import invalidate_summary
+
+        close_old_connections()
+        try:
+            FeedbackMessage.objects.bulk_create([FeedbackMessage(**row) for row in rows], batch_size=self.batch_size)
+        except Exception:  # pragma: no cover - logged, the worker must keep running
+            logger.exception("Dropped %d buffered feedback submissions", len(rows))
+        else:
+            # bulk_create sends no post_save, so refresh the inbox summary here.
+            invalidate_summary()
+        finally:
+            close_old_connections()
+
+
+feedback_buffer = FeedbackBuffer()
+atexit.register(feedback_buffer.drain)
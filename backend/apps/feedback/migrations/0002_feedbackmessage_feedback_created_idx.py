@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='feedbackmessage',
+            index=models.Index(fields=['-created_at', '-id'], name='feedback_created_idx'),
+        ),
+    ]
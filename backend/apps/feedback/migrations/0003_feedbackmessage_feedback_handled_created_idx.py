@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feedback', '0002_feedbackmessage_feedback_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='feedbackmessage',
+            index=models.Index(fields=['handled', '-created_at'], name='feedback_handled_created_idx'),
+        ),
+    ]
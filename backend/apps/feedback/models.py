@@ -1,5 +1,9 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .summary import invalidate_summary
 
 
 class FeedbackMessage(models.Model):
@@ -21,7 +25,17 @@ class FeedbackMessage(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="feedback_created_idx"),
+            models.Index(fields=["handled", "-created_at"], name="feedback_handled_created_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - human readable only
         return f"Feedback from {self.name}"
 
+
+# Deletes invalidate explicitly in the views: a post_delete receiver would turn
+# bulk queryset deletes into per-object collection.
+@receiver(post_save, sender=FeedbackMessage)
+def refresh_feedback_summary(sender, **kwargs):
+    invalidate_summary()
@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from mngfx_backend.serializers import SparseFieldsetMixin
+
 from .models import FeedbackMessage
 
 
-class FeedbackSerializer(serializers.ModelSerializer):
+class FeedbackSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = FeedbackMessage
         fields = [
@@ -25,3 +27,30 @@ class FeedbackSerializer(serializers.ModelSerializer):
             validated_data.setdefault("user", request.user)
         return super().create(validated_data)
 
+
+class FeedbackTriageSerializer(serializers.Serializer):
+    HANDLE = "handle"
+    UNHANDLE = "unhandle"
+    DELETE = "delete"
+    ACTIONS = (HANDLE, UNHANDLE, DELETE)
+    FILTER_KEYS = ("handled", "rating", "from", "to")
+
+    action = serializers.ChoiceField(choices=ACTIONS)
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=10000)
+    filter = serializers.DictField(child=serializers.CharField(), required=False)
+
+    def validate(self, attrs):
+        ids = attrs.get("ids")
+        filters = attrs.get("filter")
+        if (ids is None) == (filters is None):
+            raise serializers.ValidationError("Send either ids or filter.")
+        if ids is not None and not ids:
+            raise serializers.ValidationError({"ids": "Select at least one message."})
+        if filters is not None:
+            unknown = set(filters) - set(self.FILTER_KEYS)
+            if unknown:
+                raise serializers.ValidationError({"filter": f"Unknown keys: {', '.join(sorted(unknown))}."})
+            # An empty filter would silently match the whole inbox.
+            if not any(filters.values()):
+                raise serializers.ValidationError({"filter": "Give at least one of handled, rating, from, to."})
+        return attrs
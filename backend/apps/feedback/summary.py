@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.utils import timezone
+
+
+SUMMARY_KEY = "feedback:summary"
+# Writes invalidate the summary; the timeout only bounds drift from writes that
+# bypass the app (raw SQL, admin bulk delete).
+SUMMARY_TIMEOUT = 5 * 60
+
+
+def _compute() -> dict:
+    from .models import FeedbackMessage
+
+    summary = {"total": 0, "handled": 0, "unhandled": 0, "by_rating": {}}
+    rows = FeedbackMessage.objects.order_by().values_list("handled", "rating").annotate(count=Count("id"))
+    for handled, rating, count in rows:
+        status = "handled" if handled else "unhandled"
+        bucket = summary["by_rating"].setdefault(
+            "none" if rating is None else str(rating), {"handled": 0, "unhandled": 0}
+        )
+        bucket[status] += count
+        summary[status] += count
+        summary["total"] += count
+    summary["computed_at"] = timezone.now()
+    return summary
+
+
+def feedback_summary() -> dict:
+    """Inbox counts per handled status and rating, computed once per change."""
+
+    return cache.get_or_set(SUMMARY_KEY, _compute, SUMMARY_TIMEOUT)
+
+
+def invalidate_summary() -> None:
+    cache.delete(SUMMARY_KEY)
@@ -1,7 +1,19 @@
-from rest_framework import permissions, viewsets
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 
+from mngfx_backend.streaming import streaming_content
+
+from .export import CSV, EXPORT_FORMATS, csv_lines, ndjson_lines
+from .filters import filter_feedback
+from .ingest import feedback_buffer
 from .models import FeedbackMessage
-from .serializers import FeedbackSerializer
+from .serializers import FeedbackSerializer, FeedbackTriageSerializer
+from .summary import feedback_summary, invalidate_summary
 
 
 class FeedbackViewSet(viewsets.ModelViewSet):
@@ -17,4 +29,62 @@ class FeedbackViewSet(viewsets.ModelViewSet):
         qs = super().get_queryset()
         return qs.order_by("-created_at")
 
+    def create(self, request, *args, **kwargs):
+        if not settings.FEEDBACK_WRITE_BEHIND:
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        row = dict(serializer.validated_data)
+        if request.user.is_authenticated:
+            row.setdefault("user_id", request.user.pk)
+        if not feedback_buffer.submit(row):
+            # Buffer full: fall back to a direct insert rather than dropping the message.
+            self.perform_create(serializer)
+            return Response(serializer.data, status=status.HTTP_201_CREATED, headers=self.get_success_headers(serializer.data))
+        return Response({**serializer.data, "queued": True}, status=status.HTTP_202_ACCEPTED)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_summary()
+
+    @action(detail=False, methods=["post"])
+    def triage(self, request):
+        """Mark handled/unhandled or delete by ``ids`` or ``filter`` in one statement."""
+
+        serializer = FeedbackTriageSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        queryset = FeedbackMessage.objects.order_by()
+        if "ids" in data:
+            queryset = queryset.filter(id__in=data["ids"])
+        else:
+            queryset = filter_feedback(queryset, data["filter"])
+
+        if data["action"] == FeedbackTriageSerializer.DELETE:
+            affected, _ = queryset.delete()
+        else:
+            handled = data["action"] == FeedbackTriageSerializer.HANDLE
+            affected = queryset.exclude(handled=handled).update(handled=handled)
+        invalidate_summary()
+        return Response({"action": data["action"], "affected": affected})
+
+    @action(detail=False, methods=["get"])
+    def summary(self, request):
+        return Response(feedback_summary())
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Stream the filtered inbox as CSV (default) or NDJSON via ``?output=``."""
+
+        output = (request.query_params.get("output") or CSV).lower()
+        if output not in EXPORT_FORMATS:
+            raise ValidationError({"output": f"Use one of {', '.join(EXPORT_FORMATS)}."})
 
+        queryset = filter_feedback(self.get_queryset(), request.query_params).order_by("-created_at", "-id")
+        lines = csv_lines(queryset) if output == CSV else ndjson_lines(queryset)
+        response = StreamingHttpResponse(streaming_content(request, lines), content_type=EXPORT_FORMATS[output])
+        filename = f"feedback-{timezone.now():%Y%m%d-%H%M}.{output}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
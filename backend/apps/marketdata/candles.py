@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+CANDLE_FIELDS = ("start", "open", "high", "low", "close", "volume")
+
+# Bar length in milliseconds, keyed by the labels used in the course material.
+TIMEFRAMES = {
+    "1m": 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "1H": 60 * 60_000,
+    "4H": 4 * 60 * 60_000,
+    "D": 24 * 60 * 60_000,
+}
+
+
+def normalize_timeframe(raw) -> str | None:
+    if not isinstance(raw, str):
+        return None
+    raw = raw.strip()
+    if raw in TIMEFRAMES:
+        return raw
+    aliases = {"1h": "1H", "4h": "4H", "1d": "D", "d": "D", "daily": "D"}
+    return aliases.get(raw.lower())
+
+
+def bar_start(ts: int, timeframe: str) -> int:
+    length = TIMEFRAMES[timeframe]
+    return ts - ts % length
+
+
+@dataclass(slots=True)
+class Candle:
+    start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int = 1
+
+    def update(self, price: float) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "start": self.start,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        }
+
+
+class CandleAggregator:
+    """Builds OHLC bars for one symbol incrementally from its ticks.
+
+    Only the open bar of each timeframe is kept, so memory stays constant no
+    matter how long the stream runs. Bars are built from the bid price and
+    ``volume`` counts ticks. Ticks older than the open bar are ignored.
+    """
+
+    def __init__(self, symbol: str, timeframes=None):
+        self.symbol = symbol
+        self.timeframes = list(timeframes or TIMEFRAMES)
+        self.bars: dict[str, Candle | None] = {timeframe: None for timeframe in self.timeframes}
+
+    def update(self, ts: int, price: float) -> list[tuple[str, Candle, bool]]:
+        """Apply one tick and return ``(timeframe, candle, closed)`` events.
+
+        A bar that the tick rolls over is reported once with ``closed=True``
+        before the new bar; the open bar is always reported last.
+        """
+
+        events = []
+        for timeframe in self.timeframes:
+            start = bar_start(ts, timeframe)
+            bar = self.bars[timeframe]
+            if bar is None or start > bar.start:
+                if bar is not None:
+                    events.append((timeframe, bar, True))
+                bar = self.bars[timeframe] = Candle(start, price, price, price, price)
+            elif start < bar.start:
+                continue
+            else:
+                bar.update(price)
+            events.append((timeframe, bar, False))
+        return events
+
+    def update_tick(self, tick: dict) -> list[tuple[str, Candle, bool]]:
+        return self.update(tick["ts"], tick["bid"])
+
+
+def resample(ts: np.ndarray, price: np.ndarray, timeframe: str) -> dict[str, np.ndarray]:
+    """Vectorized counterpart of ``CandleAggregator`` for timestamp-sorted tick arrays.
+
+    Returns one array per ``CANDLE_FIELDS`` column; bars without ticks are omitted.
+    """
+
+    if len(ts) == 0:
+        return {
+            "start": np.empty(0, dtype=np.int64),
+            **{field: np.empty(0, dtype=np.float64) for field in ("open", "high", "low", "close")},
+            "volume": np.empty(0, dtype=np.int64),
+        }
+
+    length = TIMEFRAMES[timeframe]
+    buckets = ts - ts % length
+    starts = np.concatenate(([0], np.flatnonzero(buckets[1:] != buckets[:-1]) + 1))
+    ends = np.append(starts[1:], len(ts))
+    return {
+        "start": buckets[starts],
+        "open": price[starts],
+        "high": np.maximum.reduceat(price, starts),
+        "low": np.minimum.reduceat(price, starts),
+        "close": price[ends - 1],
+        "volume": ends - starts,
+    }
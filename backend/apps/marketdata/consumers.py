@@ -1,24 +1,229 @@
+import asyncio
+
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
+from .candles import normalize_timeframe
+from .delivery import DEFAULT_WINDOW_MS, STREAM, TickBuffer, parse_delivery
+from .snapshots import last_values, load_snapshot
+from .subscriptions import binary_group, candle_group, indicator_group, registry, requested_symbols, symbol_group
+from .wire import BINARY, FrameBuffer, last_tick, parse_encoding, symbol_ids
+
+
+MAX_SYMBOLS_PER_CONNECTION = 50
+
+# Per-timeframe streams a client can add to a symbol, by subscribe-message key.
+STREAMS = {
+    "candles": candle_group,
+    "indicators": indicator_group,
+}
+
 
 class MarketConsumer(AsyncJsonWebsocketConsumer):
     async def connect(self):
+        self.symbols = set()
+        self.streams = {stream: {} for stream in STREAMS}
+        self.joined = set()
+        self.delivery = STREAM
+        self.window_ms = DEFAULT_WINDOW_MS
+        self.buffer = None
+        self._flush_task = None
+        # Binary connections get ticks as packed frames (see wire.py); everything else stays JSON text.
+        self.encoding = parse_encoding(self.scope)
+        if self.encoding is None:
+            await self.close()
+            return
         await self.accept()
-        self.group_name = "market_broadcast"
-        await self.channel_layer.group_add(self.group_name, self.channel_name)
-        await self.send_json({"type": "welcome", "message": "connected to market feed"})
+        await self.send_json({"type": "welcome", "message": "connected to market feed", "encoding": self.encoding})
 
     async def disconnect(self, close_code):
-        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        for group in list(self.joined):
+            await self._leave(group)
 
     async def receive_json(self, content, **kwargs):
         action = content.get("action")
         if action == "subscribe":
-            symbol = content.get("symbol", "EURUSD")
-            await self.send_json({"type": "subscribed", "symbol": symbol})
+            await self._subscribe(content)
+        elif action == "unsubscribe":
+            await self._unsubscribe(content)
         else:
             await self.send_json({"type": "error", "message": "unknown action"})
 
+    async def _subscribe(self, content):
+        symbols = requested_symbols(content, default="EURUSD")
+        if not symbols:
+            await self.send_json({"type": "error", "message": "invalid symbol"})
+            return
+        if len(self.symbols | set(symbols)) > MAX_SYMBOLS_PER_CONNECTION:
+            await self.send_json({"type": "error", "message": "too many symbols"})
+            return
+        requested = self._requested_streams(content)
+        if requested is None:
+            await self.send_json({"type": "error", "message": "invalid timeframe"})
+            return
+        delivery = parse_delivery(content, self.delivery, self.window_ms)
+        if delivery is None:
+            await self.send_json({"type": "error", "message": "unknown delivery mode"})
+            return
+
+        await self._set_delivery(*delivery)
+        for symbol in symbols:
+            self.symbols.add(symbol)
+            await self._join(self._tick_group(symbol))
+            for stream, timeframes in requested.items():
+                for timeframe in timeframes:
+                    self.streams[stream].setdefault(symbol, set()).add(timeframe)
+                    await self._join(STREAMS[stream](symbol, timeframe))
+
+        reply = {
+            "type": "subscribed",
+            "symbol": symbols[0],
+            "symbols": sorted(self.symbols),
+            "delivery": self.delivery,
+            "interval": self.window_ms,
+        }
+        for stream, subscribed in self.streams.items():
+            reply[stream] = {symbol: sorted(subscribed[symbol]) for symbol in symbols if symbol in subscribed}
+        if self.encoding == BINARY:
+            reply["ids"] = {symbol: await symbol_ids.get(symbol) for symbol in symbols}
+        await self.send_json(reply)
+
+        for symbol in symbols:
+            snapshot = await load_snapshot(
+                symbol,
+                sorted(self.streams["candles"].get(symbol, ())),
+                sorted(self.streams["indicators"].get(symbol, ())),
+            )
+            if snapshot["tick"] is not None or snapshot["candles"] or snapshot["indicators"]:
+                await self.send_json({"type": "snapshot", **snapshot})
+
+    async def _unsubscribe(self, content):
+        symbols = [symbol for symbol in requested_symbols(content) if symbol in self.symbols]
+        requested = self._requested_streams(content)
+        if requested is None:
+            await self.send_json({"type": "error", "message": "invalid timeframe"})
+            return
+
+        # Naming candles/indicators drops only those streams, otherwise the whole symbol goes.
+        whole_symbol = not any(requested.values())
+        for symbol in symbols:
+            for stream, subscribed in self.streams.items():
+                current = subscribed.get(symbol, set())
+                for timeframe in list(current) if whole_symbol else requested[stream]:
+                    current.discard(timeframe)
+                    await self._leave(STREAMS[stream](symbol, timeframe))
+                if not current:
+                    subscribed.pop(symbol, None)
+            if whole_symbol:
+                self.symbols.discard(symbol)
+                await self._leave(self._tick_group(symbol))
+
+        await self.send_json({"type": "unsubscribed", "symbols": symbols, "remaining": sorted(self.symbols)})
+
+    def _tick_group(self, symbol):
+        return binary_group(symbol) if self.encoding == BINARY else symbol_group(symbol)
+
+    def _requested_streams(self, content):
+        requested = {}
+        for stream in STREAMS:
+            timeframes = self._requested_timeframes(content.get(stream))
+            if timeframes is None:
+                return None
+            requested[stream] = timeframes
+        return requested
+
+    def _requested_timeframes(self, raw):
+        raw = raw or []
+        if isinstance(raw, str):
+            raw = raw.split(",")
+        if not isinstance(raw, (list, tuple)):
+            return None
+        timeframes = [normalize_timeframe(item) for item in raw]
+        if None in timeframes:
+            return None
+        return list(dict.fromkeys(timeframes))
+
     async def market_tick(self, event):
-        await self.send_json({"type": "tick", "tick": event["tick"]})
+        last_values.update_tick(event["tick"])
+        await self._deliver([event["tick"]])
+
+    async def market_ticks(self, event):
+        if last_values.first_delivery(("tick", event.get("symbol")), event.get("seq")):
+            for tick in event["ticks"]:
+                last_values.update_tick(tick)
+        await self._deliver(event["ticks"])
+
+    async def _deliver(self, ticks):
+        if self.buffer is None:
+            for tick in ticks:
+                await self.send_json({"type": "tick", "tick": tick})
+            return
+        for tick in ticks:
+            self.buffer.add(tick)
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def market_frame(self, event):
+        frame = event["frame"]
+        if last_values.first_delivery(("tick", event["symbol"]), event.get("seq")):
+            last_values.update_tick(last_tick(event["symbol"], frame))
+        if self.buffer is None:
+            await self.send(bytes_data=frame)
+            return
+        self.buffer.add(frame)
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def market_candle(self, event):
+        if last_values.first_delivery(("candle", event["symbol"], event["tf"]), event.get("seq")):
+            last_values.update_candle(event["symbol"], event["tf"], event["candle"], event["closed"])
+        await self.send_json(
+            {
+                "type": "candle",
+                "symbol": event["symbol"],
+                "tf": event["tf"],
+                "candle": event["candle"],
+                "closed": event["closed"],
+            }
+        )
+
+    async def market_indicators(self, event):
+        result = {"start": event["start"], "values": event["values"], "zones": event["zones"]}
+        if last_values.first_delivery(("indicators", event["symbol"], event["tf"]), event.get("seq")):
+            last_values.update_indicators(event["symbol"], event["tf"], result)
+        await self.send_json({"type": "indicators", "symbol": event["symbol"], "tf": event["tf"], **result})
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.window_ms / 1000)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self):
+        payload = self.buffer.drain() if self.buffer is not None else None
+        if isinstance(payload, bytes):
+            await self.send(bytes_data=payload)
+        elif payload is not None:
+            await self.send_json(payload)
+
+    async def _set_delivery(self, mode, window_ms):
+        if mode != self.delivery:
+            await self._flush()
+            buffer_class = FrameBuffer if self.encoding == BINARY else TickBuffer
+            self.buffer = None if mode == STREAM else buffer_class(mode)
+        self.delivery = mode
+        self.window_ms = window_ms
+
+    async def _join(self, group):
+        if group in self.joined:
+            return
+        self.joined.add(group)
+        await self.channel_layer.group_add(group, self.channel_name)
+        await registry.add(group)
 
+    async def _leave(self, group):
+        if group not in self.joined:
+            return
+        self.joined.discard(group)
+        await self.channel_layer.group_discard(group, self.channel_name)
+        await registry.remove(group)
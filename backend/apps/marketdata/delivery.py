@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from collections import deque
+
+
+STREAM = "stream"
+LATEST = "latest"
+BATCH = "batch"
+DELIVERY_MODES = (STREAM, LATEST, BATCH)
+
+DEFAULT_WINDOW_MS = 100
+MIN_WINDOW_MS = 50
+MAX_WINDOW_MS = 1000
+MAX_BATCH_TICKS = 500
+
+BATCH_FIELDS = ["ts", "bid", "ask"]
+
+
+def parse_delivery(content: dict, current_mode: str = STREAM, current_window_ms: int = DEFAULT_WINDOW_MS):
+    """Read the optional ``delivery``/``interval`` fields of a subscribe message.
+
+    Returns ``(mode, window_ms)`` or ``None`` when the requested mode is unknown.
+    The window is clamped to ``MIN_WINDOW_MS..MAX_WINDOW_MS``.
+    """
+
+    mode = content.get("delivery", current_mode)
+    if mode not in DELIVERY_MODES:
+        return None
+
+    window_ms = content.get("interval", current_window_ms)
+    try:
+        window_ms = int(window_ms)
+    except (TypeError, ValueError):
+        window_ms = DEFAULT_WINDOW_MS
+    return mode, max(MIN_WINDOW_MS, min(MAX_WINDOW_MS, window_ms))
+
+
+class TickBuffer:
+    """Collects ticks between flushes for one connection.
+
+    ``latest`` keeps only the newest quote per symbol; ``batch`` keeps every tick
+    as a compact ``[ts, bid, ask]`` row (bounded by ``MAX_BATCH_TICKS`` per symbol).
+    """
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self._pending: dict = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def add(self, tick: dict) -> None:
+        symbol = tick["symbol"]
+        if self.mode == LATEST:
+            self._pending[symbol] = tick
+            return
+
+        rows = self._pending.get(symbol)
+        if rows is None:
+            rows = self._pending[symbol] = deque(maxlen=MAX_BATCH_TICKS)
+        rows.append([tick["ts"], tick["bid"], tick["ask"]])
+
+    def drain(self) -> dict | None:
+        if not self._pending:
+            return None
+
+        pending, self._pending = self._pending, {}
+        if self.mode == LATEST:
+            return {"type": "quotes", "quotes": list(pending.values())}
+        return {
+            "type": "batch",
+            "fields": BATCH_FIELDS,
+            "ticks": {symbol: list(rows) for symbol, rows in pending.items()},
+        }
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import logging
+import random
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+import numpy as np
+
+from .storage import DAY_MS, TickStore
+from .subscriptions import normalize_symbol
+
+
+logger = logging.getLogger(__name__)
+
+BASE_PRICES = {
+    "EURUSD": 1.05,
+    "GBPUSD": 1.25,
+    "USDJPY": 150.0,
+    "AUDUSD": 0.65,
+    "USDCAD": 1.36,
+    "USDCHF": 0.88,
+    "NZDUSD": 0.6,
+    "XAUUSD": 2000.0,
+}
+READ_CHUNK = 64 * 1024
+
+# Every source is an async iterator of tick batches (lists of {symbol, bid, ask, ts} dicts).
+
+
+def parse_tick(raw) -> dict | None:
+    """Normalize a tick from a CSV row, JSON object or ``symbol,ts,bid,ask`` line."""
+
+    try:
+        if isinstance(raw, str):
+            raw = raw.strip()
+            if raw.startswith("{"):
+                raw = json.loads(raw)
+            else:
+                raw = dict(zip(("symbol", "ts", "bid", "ask"), raw.split(",")))
+        symbol = normalize_symbol(raw["symbol"])
+        tick = {"symbol": symbol, "bid": float(raw["bid"]), "ask": float(raw["ask"]), "ts": int(float(raw["ts"]))}
+    except (KeyError, TypeError, ValueError):
+        return None
+    return tick if symbol else None
+
+
+class RandomWalkSource:
+    """Synthetic quotes for ``symbols`` at roughly ``rate`` ticks per second in total."""
+
+    def __init__(self, symbols, rate: float = 10.0, batch_interval: float = 0.05, volatility: float = 0.00005):
+        self.symbols = list(symbols)
+        self.rate = rate
+        self.batch_interval = batch_interval
+        self.volatility = volatility
+        self.prices = {symbol: BASE_PRICES.get(symbol, 1.0) for symbol in self.symbols}
+
+    def _tick(self, symbol: str, ts: int) -> dict:
+        price = self.prices[symbol] * (1 + random.gauss(0, self.volatility))
+        self.prices[symbol] = price
+        return {
+            "symbol": symbol,
+            "bid": round(price, 5),
+            "ask": round(price * 1.0001, 5),
+            "ts": ts,
+        }
+
+    async def __aiter__(self) -> AsyncIterator[list[dict]]:
+        owed = 0.0
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        while True:
+            owed += self.rate * self.batch_interval
+            count, owed = int(owed), owed - int(owed)
+            ts = int(time.time() * 1000)
+            if count:
+                yield [self._tick(random.choice(self.symbols), ts) for _ in range(count)]
+            next_at += self.batch_interval
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+
+
+class ReplaySource:
+    """Replays recorded ticks at ``speed`` times real time.
+
+    Ticks come from a CSV file (``symbol,ts,bid,ask`` with a header row) or,
+    without a path, from the tick store between ``start`` and ``end``.
+    Original timestamps are kept so candles match the recorded session.
+    """
+
+    def __init__(self, path=None, symbols=None, speed: float = 1.0, start: int = 0, end: int | None = None,
+                 max_batch: int = 5_000):
+        self.path = Path(path) if path else None
+        self.symbols = list(symbols or [])
+        self.speed = speed
+        self.start = start
+        self.end = end if end is not None else int(time.time() * 1000)
+        self.max_batch = max_batch
+
+    def _ticks(self):
+        if self.path is not None:
+            with open(self.path, newline="") as handle:
+                for row in csv.DictReader(handle):
+                    tick = parse_tick(row)
+                    if tick and (not self.symbols or tick["symbol"] in self.symbols):
+                        yield tick
+            return
+
+        # Merge the per-symbol store segments one day at a time into a single ordered stream.
+        store = TickStore()
+        symbols = self.symbols or store.symbols()
+        for day_start in range(self.start - self.start % DAY_MS, self.end, DAY_MS):
+            day_end = min(day_start + DAY_MS, self.end)
+            parts = [(symbol, store.query(symbol, max(day_start, self.start), day_end)) for symbol in symbols]
+            parts = [(symbol, rows) for symbol, rows in parts if len(rows)]
+            if not parts:
+                continue
+            rows = np.concatenate([rows for _, rows in parts])
+            names = np.repeat([symbol for symbol, _ in parts], [len(rows) for _, rows in parts])
+            order = np.argsort(rows["ts"], kind="stable")
+            for (ts, bid, ask), symbol in zip(rows[order].tolist(), names[order].tolist()):
+                yield {"symbol": symbol, "bid": bid, "ask": ask, "ts": ts}
+
+    async def __aiter__(self) -> AsyncIterator[list[dict]]:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        first_ts = None
+        batch: list[dict] = []
+        for tick in self._ticks():
+            if first_ts is None:
+                first_ts = tick["ts"]
+            due = started_at + (tick["ts"] - first_ts) / 1000 / self.speed
+            if (due > loop.time() and batch) or len(batch) >= self.max_batch:
+                yield batch
+                batch = []
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            batch.append(tick)
+        if batch:
+            yield batch
+
+
+class TCPSource:
+    """Reads newline-delimited ticks (JSON objects or CSV lines) from a local TCP feed.
+
+    Reconnects with a capped backoff when the feed goes away. Every complete
+    line in a socket read becomes part of the same batch.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9100, max_batch: int = 5_000):
+        self.host = host
+        self.port = port
+        self.max_batch = max_batch
+
+    async def __aiter__(self) -> AsyncIterator[list[dict]]:
+        backoff = 0.5
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+            except OSError as exc:
+                logger.warning("Tick feed %s:%s unavailable: %s", self.host, self.port, exc)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10.0)
+                continue
+
+            backoff = 0.5
+            pending = b""
+            try:
+                while True:
+                    chunk = await reader.read(READ_CHUNK)
+                    if not chunk:
+                        break
+                    lines = (pending + chunk).split(b"\n")
+                    pending = lines.pop()
+                    batch = [tick for tick in map(parse_tick, (line.decode(errors="replace") for line in lines)) if tick]
+                    for offset in range(0, len(batch), self.max_batch):
+                        yield batch[offset:offset + self.max_batch]
+            except ConnectionError as exc:
+                logger.warning("Tick feed %s:%s dropped: %s", self.host, self.port, exc)
+            finally:
+                writer.close()
+            await asyncio.sleep(backoff)
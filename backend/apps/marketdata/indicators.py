@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+INDICATOR_PATTERN = re.compile(r"^(sma|ema|atr|rsi)(\d{1,3})$")
+DEFAULT_INDICATORS = ("sma20", "sma50", "ema20", "atr14", "rsi14")
+SWING_STRENGTH = 2
+MAX_ZONES = 5
+
+
+def parse_indicators(raw) -> list[str] | None:
+    """Validate indicator names such as ``sma20`` or ``atr14``; ``None`` if any is unknown."""
+
+    if isinstance(raw, str):
+        raw = raw.split(",")
+    names = []
+    for item in raw or []:
+        name = str(item).strip().lower()
+        match = INDICATOR_PATTERN.match(name)
+        if not match or not 1 <= int(match.group(2)) <= 500:
+            return None
+        if name not in names:
+            names.append(name)
+    return names
+
+
+# Incremental indicators: one update per closed bar, constant work and memory each.
+
+
+class SMA:
+    def __init__(self, period: int):
+        self.period = period
+        self.window: deque = deque()
+        self.total = 0.0
+
+    def update(self, value: float) -> float | None:
+        self.window.append(value)
+        self.total += value
+        if len(self.window) > self.period:
+            self.total -= self.window.popleft()
+        return self.total / self.period if len(self.window) == self.period else None
+
+
+class EMA:
+    """Exponential average seeded with the simple average of the first ``period`` values.
+
+    ``alpha`` defaults to ``2 / (period + 1)``; Wilder smoothing uses ``1 / period``.
+    """
+
+    def __init__(self, period: int, alpha: float | None = None):
+        self.period = period
+        self.alpha = alpha if alpha is not None else 2 / (period + 1)
+        self.seed = SMA(period)
+        self.value: float | None = None
+
+    def update(self, value: float) -> float | None:
+        if self.value is None:
+            self.value = self.seed.update(value)
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+class ATR:
+    def __init__(self, period: int):
+        self.average = EMA(period, alpha=1 / period)
+        self.prev_close: float | None = None
+
+    def update(self, high: float, low: float, close: float) -> float | None:
+        if self.prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        return self.average.update(true_range)
+
+
+class RSI:
+    def __init__(self, period: int):
+        self.gains = EMA(period, alpha=1 / period)
+        self.losses = EMA(period, alpha=1 / period)
+        self.prev_close: float | None = None
+
+    def update(self, close: float) -> float | None:
+        if self.prev_close is None:
+            self.prev_close = close
+            return None
+        change = close - self.prev_close
+        self.prev_close = close
+        gain = self.gains.update(max(change, 0.0))
+        loss = self.losses.update(max(-change, 0.0))
+        if gain is None or loss is None:
+            return None
+        if loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + gain / loss)
+
+
+class SwingZones:
+    """Supply/demand zones from confirmed swing highs and lows.
+
+    A bar is a swing high (low) when its high (low) is strictly above (below)
+    the ``strength`` bars on either side, so it is confirmed ``strength`` bars
+    later. A supply zone spans the swing bar's body top to its high, a demand
+    zone its low to the body bottom. Zones are dropped once a close breaks
+    through them and at most ``max_zones`` per side are kept.
+    """
+
+    def __init__(self, strength: int = SWING_STRENGTH, max_zones: int = MAX_ZONES):
+        self.strength = strength
+        self.bars: deque = deque(maxlen=2 * strength + 1)
+        self.supply: deque = deque(maxlen=max_zones)
+        self.demand: deque = deque(maxlen=max_zones)
+
+    def update(self, candle: dict) -> dict:
+        self.bars.append(candle)
+        close = candle["close"]
+        self.supply = deque((zone for zone in self.supply if close <= zone["top"]), maxlen=self.supply.maxlen)
+        self.demand = deque((zone for zone in self.demand if close >= zone["bottom"]), maxlen=self.demand.maxlen)
+
+        if len(self.bars) == self.bars.maxlen:
+            pivot = self.bars[self.strength]
+            others = [bar for index, bar in enumerate(self.bars) if index != self.strength]
+            if all(pivot["high"] > bar["high"] for bar in others):
+                self.supply.append(
+                    {"start": pivot["start"], "bottom": max(pivot["open"], pivot["close"]), "top": pivot["high"]}
+                )
+            if all(pivot["low"] < bar["low"] for bar in others):
+                self.demand.append(
+                    {"start": pivot["start"], "bottom": pivot["low"], "top": min(pivot["open"], pivot["close"])}
+                )
+        return {"supply": list(self.supply), "demand": list(self.demand)}
+
+
+class IndicatorEngine:
+    """Runs a set of named indicators plus swing zones over one closed-candle stream."""
+
+    def __init__(self, names=DEFAULT_INDICATORS, strength: int = SWING_STRENGTH):
+        self.names = list(names)
+        self.indicators = {}
+        for name in self.names:
+            kind, period = INDICATOR_PATTERN.match(name).groups()
+            self.indicators[name] = {"sma": SMA, "ema": EMA, "atr": ATR, "rsi": RSI}[kind](int(period))
+        self.zones = SwingZones(strength)
+
+    def update(self, candle: dict) -> dict:
+        values = {}
+        for name, indicator in self.indicators.items():
+            if isinstance(indicator, ATR):
+                values[name] = indicator.update(candle["high"], candle["low"], candle["close"])
+            else:
+                values[name] = indicator.update(candle["close"])
+        return {"start": candle["start"], "values": values, "zones": self.zones.update(candle)}
+
+
+# Batch versions over whole columns, matching the incremental results bar for bar.
+
+
+def _smooth(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    out = np.full(len(values), np.nan)
+    if len(values) < period:
+        return out
+    out[period - 1] = values[:period].mean()
+    # The recursion is inherently sequential; run it over plain floats.
+    current = out[period - 1]
+    tail = values[period:].tolist()
+    for offset, value in enumerate(tail, start=period):
+        current += alpha * (value - current)
+        out[offset] = current
+    return out
+
+
+def sma(close: np.ndarray, period: int) -> np.ndarray:
+    out = np.full(len(close), np.nan)
+    if len(close) >= period:
+        sums = np.cumsum(np.concatenate(([0.0], close)))
+        out[period - 1:] = (sums[period:] - sums[:-period]) / period
+    return out
+
+
+def ema(close: np.ndarray, period: int) -> np.ndarray:
+    return _smooth(np.asarray(close, dtype=np.float64), period, 2 / (period + 1))
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return _smooth(true_range, period, 1 / period)
+
+
+def rsi(close: np.ndarray, period: int) -> np.ndarray:
+    out = np.full(len(close), np.nan)
+    if len(close) < 2:
+        return out
+    change = np.diff(close)
+    gains = _smooth(np.maximum(change, 0.0), period, 1 / period)
+    losses = _smooth(np.maximum(-change, 0.0), period, 1 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = np.where(losses == 0, 100.0, 100 - 100 / (1 + gains / losses))
+    out[1:] = np.where(np.isnan(gains), np.nan, values)
+    return out
+
+
+def swings(high: np.ndarray, low: np.ndarray, strength: int = SWING_STRENGTH) -> tuple[np.ndarray, np.ndarray]:
+    """Boolean swing-high and swing-low flags, placed on the pivot bar itself."""
+
+    size = 2 * strength + 1
+    swing_high = np.zeros(len(high), dtype=bool)
+    swing_low = np.zeros(len(low), dtype=bool)
+    if len(high) < size:
+        return swing_high, swing_low
+
+    def pivots(values, extreme):
+        windows = sliding_window_view(values, size)
+        centre = windows[:, strength]
+        best = extreme(windows, axis=1)
+        unique = (windows == best[:, None]).sum(axis=1) == 1
+        return (centre == best) & unique
+
+    swing_high[strength:len(high) - strength] = pivots(high, np.max)
+    swing_low[strength:len(low) - strength] = pivots(low, np.min)
+    return swing_high, swing_low
+
+
+def compute(names, candles: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Batch-compute named indicators over candle columns (``open/high/low/close``)."""
+
+    out = {}
+    high, low, close = candles["high"], candles["low"], candles["close"]
+    for name in names:
+        kind, period = INDICATOR_PATTERN.match(name).groups()
+        period = int(period)
+        if kind == "sma":
+            out[name] = sma(close, period)
+        elif kind == "ema":
+            out[name] = ema(close, period)
+        elif kind == "atr":
+            out[name] = atr(high, low, close, period)
+        else:
+            out[name] = rsi(close, period)
+    return out
+
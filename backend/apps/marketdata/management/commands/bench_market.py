@@ -0,0 +1,213 @@
+import asyncio
+import json
+import resource
+import time
+from collections import Counter
+
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.marketdata.consumers import MarketConsumer
+from apps.marketdata.delivery import DELIVERY_MODES, STREAM
+from apps.marketdata.feeds import RandomWalkSource
+from apps.marketdata.publisher import TickPublisher
+from apps.marketdata.subscriptions import normalize_symbol
+from apps.marketdata.wire import ENCODINGS, FRAME_HEADER, JSON, TICK_RECORD
+
+
+LATENCY_CLIENTS = 100
+
+
+class StampedSource:
+    """Wraps a source for ``duration`` seconds, tagging each tick with a sequence number.
+
+    The creation time of every tick is kept so clients can compute end-to-end latency.
+    """
+
+    def __init__(self, source, duration: float):
+        self.source = source
+        self.duration = duration
+        self.sent_at: dict[int, float] = {}
+        self.per_symbol: Counter = Counter()
+        self._seq = 0
+
+    async def __aiter__(self):
+        deadline = time.perf_counter() + self.duration
+        async for batch in self.source:
+            now = time.perf_counter()
+            for tick in batch:
+                self._seq += 1
+                tick["seq"] = self._seq
+                self.sent_at[self._seq] = now
+                self.per_symbol[tick["symbol"]] += 1
+            yield batch
+            if now >= deadline:
+                return
+
+
+class BenchClient:
+    def __init__(self, index: int, symbols: list[str], sent_at: dict, track_latency: bool, encoding: str = JSON):
+        self.index = index
+        self.symbols = symbols
+        self.sent_at = sent_at
+        self.track_latency = track_latency
+        self.communicator = WebsocketCommunicator(MarketConsumer.as_asgi(), f"/ws/market/?encoding={encoding}")
+        self.frames = 0
+        self.bytes = 0
+        self.ticks = 0
+        self.latencies: list[float] = []
+
+    async def connect(self, delivery: str, interval: int) -> None:
+        connected, _ = await self.communicator.connect()
+        if not connected:
+            raise CommandError(f"client {self.index} could not connect")
+        await self.communicator.receive_json_from()
+        await self.communicator.send_json_to(
+            {"action": "subscribe", "symbols": self.symbols, "delivery": delivery, "interval": interval}
+        )
+        while (await self.communicator.receive_json_from())["type"] != "subscribed":
+            pass
+
+    async def listen(self) -> None:
+        queue = self.communicator.output_queue
+        while True:
+            message = await queue.get()
+            received_at = time.perf_counter()
+            if message.get("type") != "websocket.send":
+                continue
+            if message.get("bytes") is not None:
+                self.frames += 1
+                self.bytes += len(message["bytes"])
+                self.ticks += self._count_records(message["bytes"])
+                continue
+            if "text" not in message:
+                continue
+            payload = json.loads(message["text"])
+            self.frames += 1
+            self.bytes += len(message["text"])
+            kind = payload["type"]
+            if kind == "tick":
+                ticks = [payload["tick"]]
+            elif kind == "quotes":
+                ticks = payload["quotes"]
+            elif kind == "batch":
+                self.ticks += sum(len(rows) for rows in payload["ticks"].values())
+                continue
+            else:
+                continue
+            self.ticks += len(ticks)
+            if self.track_latency:
+                self.latencies.extend(received_at - self.sent_at[tick["seq"]] for tick in ticks if "seq" in tick)
+
+    @staticmethod
+    def _count_records(data: bytes) -> int:
+        count = offset = 0
+        while offset < len(data):
+            _, _, records = FRAME_HEADER.unpack_from(data, offset)
+            count += records
+            offset += FRAME_HEADER.size + records * TICK_RECORD.size
+        return count
+
+    async def close(self) -> None:
+        await self.communicator.disconnect()
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark MarketConsumer fan-out in-process on the in-memory channel layer: N simulated "
+        "clients, a random-walk publisher at a fixed rate, latency/drop/CPU report. "
+        "Run with CHANNEL_LAYER_BACKEND=inmemory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, default=100)
+        parser.add_argument("--rate", type=float, default=1000.0, help="Ticks per second across all symbols.")
+        parser.add_argument("--duration", type=float, default=10.0, help="Seconds of publishing.")
+        parser.add_argument("--drain", type=float, default=1.0, help="Seconds to wait for in-flight frames afterwards.")
+        parser.add_argument("--symbols", default=",".join(settings.MARKETDATA_SYMBOLS))
+        parser.add_argument("--symbols-per-client", type=int, default=1)
+        parser.add_argument("--delivery", choices=DELIVERY_MODES, default=STREAM)
+        parser.add_argument("--encoding", choices=ENCODINGS, default=JSON, help="Wire format negotiated by the clients.")
+        parser.add_argument("--interval", type=int, default=100, help="Coalescing window (ms) for latest/batch delivery.")
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+
+    def handle(self, *args, **options):
+        if settings.CHANNEL_LAYER_BACKEND != "inmemory":
+            raise CommandError("bench_market runs in-process; set CHANNEL_LAYER_BACKEND=inmemory.")
+        symbols = [symbol for symbol in map(normalize_symbol, options["symbols"].split(",")) if symbol]
+        if not symbols or options["clients"] < 1:
+            raise CommandError("Need at least one symbol and one client.")
+
+        report = asyncio.run(self._run(symbols, options))
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        for key, value in report.items():
+            self.stdout.write(f"{key:>24}: {value}")
+
+    async def _run(self, symbols, options):
+        per_client = max(1, min(options["symbols_per_client"], len(symbols)))
+        source = StampedSource(RandomWalkSource(symbols, rate=options["rate"]), options["duration"])
+        clients = [
+            BenchClient(
+                index,
+                [symbols[(index + offset) % len(symbols)] for offset in range(per_client)],
+                source.sent_at,
+                track_latency=index < LATENCY_CLIENTS,
+                encoding=options["encoding"],
+            )
+            for index in range(options["clients"])
+        ]
+        for client in clients:
+            await client.connect(options["delivery"], options["interval"])
+        subscribers = Counter(symbol for client in clients for symbol in client.symbols)
+        listeners = [asyncio.ensure_future(client.listen()) for client in clients]
+
+        publisher = TickPublisher(get_channel_layer(), share_snapshots=False)
+        cpu_started, wall_started = time.process_time(), time.perf_counter()
+        await publisher.run(source)
+        await asyncio.sleep(options["drain"])
+        cpu, wall = time.process_time() - cpu_started, time.perf_counter() - wall_started
+
+        for listener in listeners:
+            listener.cancel()
+        for client in clients:
+            await client.close()
+
+        expected = sum(count * subscribers[symbol] for symbol, count in source.per_symbol.items())
+        received = sum(client.ticks for client in clients)
+        frames = sum(client.frames for client in clients)
+        egress = sum(client.bytes for client in clients)
+        latencies = [latency * 1000 for client in clients for latency in client.latencies]
+        dropped = max(0, expected - received)
+        return {
+            "clients": len(clients),
+            "symbols": len(symbols),
+            "delivery": options["delivery"],
+            "encoding": options["encoding"],
+            "published_ticks": publisher.published,
+            "publish_rate": round(publisher.published / options["duration"], 1),
+            "expected_deliveries": expected,
+            "received_ticks": received,
+            # Coalescing in "latest" mode skips ticks on purpose, so these are not losses there.
+            "dropped": dropped,
+            "dropped_pct": round(100 * dropped / expected, 3) if expected else 0.0,
+            "frames": frames,
+            "frames_per_client_s": round(frames / len(clients) / wall, 2),
+            "egress_mb": round(egress / 1e6, 3),
+            "bytes_per_tick": round(egress / received, 1) if received else None,
+            # Batch rows and binary records carry no sequence number, so those report no latency samples.
+            "latency_p50_ms": round(percentile(latencies, 0.5), 3) if latencies else None,
+            "latency_p99_ms": round(percentile(latencies, 0.99), 3) if latencies else None,
+            "latency_max_ms": round(max(latencies), 3) if latencies else None,
+            "cpu_seconds": round(cpu, 3),
+            "cpu_cores_per_1k_clients": round(cpu / wall / len(clients) * 1000, 3),
+            "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        }
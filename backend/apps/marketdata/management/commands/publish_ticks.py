@@ -1,13 +1,35 @@
-import random
+import asyncio
 import time
 
-from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.marketdata.feeds import RandomWalkSource, ReplaySource, TCPSource
+from apps.marketdata.publisher import TickPublisher
+from apps.marketdata.snapshots import shared_snapshots_enabled
+from apps.marketdata.storage import DAY_MS, TickWriter
+from apps.marketdata.subscriptions import normalize_symbol
 
 
 class Command(BaseCommand):
-    help = "Publish fake market ticks to the channel layer for testing"
+    help = "Publish market ticks to the channel layer from a random walk, a recording or a local TCP feed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--source", choices=["random", "replay", "tcp"], default="random")
+        parser.add_argument(
+            "--symbols",
+            default=",".join(settings.MARKETDATA_SYMBOLS),
+            help="Comma separated symbols to publish (defaults to MARKETDATA_SYMBOLS).",
+        )
+        parser.add_argument("--rate", type=float, default=10.0, help="Random source: ticks per second across all symbols.")
+        parser.add_argument("--file", help="Replay source: CSV with symbol,ts,bid,ask columns. Defaults to the tick store.")
+        parser.add_argument("--speed", type=float, default=1.0, help="Replay source: playback speed multiplier.")
+        parser.add_argument("--from", dest="start", type=int, help="Replay source: first tick timestamp (ms) from the store.")
+        parser.add_argument("--to", dest="end", type=int, help="Replay source: end timestamp (ms) from the store.")
+        parser.add_argument("--host", default="127.0.0.1", help="TCP source: feed host.")
+        parser.add_argument("--port", type=int, default=9100, help="TCP source: feed port.")
+        parser.add_argument("--store", action="store_true", help="Persist published ticks to MARKETDATA_TICK_DIR.")
 
     def handle(self, *args, **options):
         channel_layer = get_channel_layer()
@@ -15,23 +37,31 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR("Channel layer is not configured."))
             return
 
-        self.stdout.write("Starting fake tick publisher. Press Ctrl+C to stop.")
+        symbols = [symbol for symbol in map(normalize_symbol, options["symbols"].split(",")) if symbol]
+        if not symbols:
+            self.stdout.write(self.style.ERROR("No valid symbols to publish."))
+            return
+
+        source = self._source(options, symbols)
+        writer = TickWriter() if options["store"] else None
+        publisher = TickPublisher(channel_layer, writer=writer, share_snapshots=shared_snapshots_enabled())
+
+        self.stdout.write(f"Starting {options['source']} tick publisher for {', '.join(symbols)}. Press Ctrl+C to stop.")
+        started = time.monotonic()
         try:
-            while True:
-                tick = {
-                    "symbol": "EURUSD",
-                    "bid": round(1.05 + random.random() * 0.01, 5),
-                    "ask": round(1.05 + random.random() * 0.01 + 0.0001, 5),
-                    "ts": int(time.time() * 1000),
-                }
-                async_to_sync(channel_layer.group_send)(
-                    "market_broadcast",
-                    {
-                        "type": "market.tick",
-                        "tick": tick,
-                    },
-                )
-                time.sleep(0.5)
+            asyncio.run(publisher.run(source))
         except KeyboardInterrupt:
-            self.stdout.write("Stopped tick publisher.")
+            pass
+        elapsed = max(time.monotonic() - started, 1e-9)
+        self.stdout.write(f"Stopped tick publisher after {publisher.published} ticks ({publisher.published / elapsed:.0f}/s).")
 
+    def _source(self, options, symbols):
+        if options["source"] == "tcp":
+            return TCPSource(options["host"], options["port"])
+        if options["source"] == "replay":
+            if options["speed"] <= 0:
+                raise CommandError("--speed must be positive.")
+            end = options["end"] or int(time.time() * 1000)
+            start = options["start"] if options["start"] is not None else end - DAY_MS
+            return ReplaySource(options["file"], symbols=symbols, speed=options["speed"], start=start, end=end)
+        return RandomWalkSource(symbols, rate=options["rate"])
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+
+from .candles import TIMEFRAMES, CandleAggregator
+from .indicators import IndicatorEngine
+from .snapshots import last_values, publish_shared
+from .subscriptions import binary_group, candle_group, indicator_group, registry, symbol_group
+from .wire import encode_ticks, symbol_ids
+
+
+QUEUE_BATCHES = 64
+SEND_CONCURRENCY = 100
+ACTIVE_REFRESH = 0.25
+SHARED_SNAPSHOT_INTERVAL = 1.0
+
+
+class TickPublisher:
+    """Moves tick batches from a source onto the channel layer on one event loop.
+
+    Each batch becomes at most one ``market.ticks`` event per symbol group (and
+    one pre-encoded ``market.frame`` for binary subscribers, packed once here for
+    all of them) plus the candle and indicator events it produced, sent concurrently. The source feeds a bounded
+    queue, so a slow channel layer pauses the source instead of piling up ticks.
+    """
+
+    def __init__(self, channel_layer, writer=None, share_snapshots: bool = True, queue_batches: int = QUEUE_BATCHES):
+        self.channel_layer = channel_layer
+        self.writer = writer
+        self.share_snapshots = share_snapshots
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_batches)
+        self.aggregators: dict[str, CandleAggregator] = {}
+        self.engines: dict[tuple[str, str], IndicatorEngine] = {}
+        self.groups: list[str] = []
+        self.active: set[str] = set()
+        self._active_at = 0.0
+        self._shared_at = 0.0
+        self._semaphore = asyncio.Semaphore(SEND_CONCURRENCY)
+        self.published = 0
+        # Stamped on events so consumers update their process's last values once
+        # per message; starts from the clock so a restart never reuses a number.
+        self._seq = itertools.count(time.time_ns())
+
+    def _aggregator(self, symbol: str) -> CandleAggregator:
+        aggregator = self.aggregators.get(symbol)
+        if aggregator is None:
+            aggregator = self.aggregators[symbol] = CandleAggregator(symbol)
+            self.groups.extend((symbol_group(symbol), binary_group(symbol)))
+            self.groups.extend(candle_group(symbol, timeframe) for timeframe in TIMEFRAMES)
+            self.groups.extend(indicator_group(symbol, timeframe) for timeframe in TIMEFRAMES)
+            self.engines.update(((symbol, timeframe), IndicatorEngine()) for timeframe in TIMEFRAMES)
+            self._active_at = 0.0
+        return aggregator
+
+    async def run(self, source) -> None:
+        producer = asyncio.ensure_future(self._produce(source))
+        try:
+            while (batch := await self.queue.get()) is not None:
+                await self.publish(batch)
+            await producer
+        finally:
+            producer.cancel()
+            if self.writer is not None:
+                self.writer.close()
+
+    async def _produce(self, source) -> None:
+        try:
+            async for batch in source:
+                await self.queue.put(batch)
+        finally:
+            await self.queue.put(None)
+
+    async def publish(self, batch: list[dict]) -> None:
+        now = time.monotonic()
+        if now - self._active_at >= ACTIVE_REFRESH:
+            for tick in batch:
+                self._aggregator(tick["symbol"])
+            self.active = set(await registry.aactive(self.groups))
+            self._active_at = now
+
+        ticks: dict[str, list[dict]] = {}
+        binary: dict[str, list[dict]] = {}
+        closed_bars: dict[tuple[str, str], list[dict]] = {}
+        open_bars = {}
+        for tick in batch:
+            symbol = tick["symbol"]
+            if self.writer is not None:
+                self.writer.add(tick)
+            last_values.update_tick(tick)
+            # Candles are built even without listeners so a new subscriber joins a correct bar.
+            for timeframe, candle, closed in self._aggregator(symbol).update_tick(tick):
+                if closed:
+                    closed_bars.setdefault((symbol, timeframe), []).append(candle.as_dict())
+                else:
+                    open_bars[(symbol, timeframe)] = candle
+            if symbol_group(symbol) in self.active:
+                ticks.setdefault(symbol, []).append(tick)
+            if binary_group(symbol) in self.active:
+                binary.setdefault(symbol, []).append(tick)
+
+        # Within one batch only the final state of each open bar is published;
+        # indicators advance on closed bars only.
+        streams: dict[str, list[dict]] = {}
+        for (symbol, timeframe), candle in open_bars.items():
+            events = [(bar, True) for bar in closed_bars.get((symbol, timeframe), ())]
+            events.append((candle.as_dict(), False))
+            group = candle_group(symbol, timeframe)
+            for bar, closed in events:
+                last_values.update_candle(symbol, timeframe, bar, closed)
+                if group in self.active:
+                    streams.setdefault(group, []).append(
+                        {
+                            "type": "market.candle",
+                            "symbol": symbol,
+                            "tf": timeframe,
+                            "seq": next(self._seq),
+                            "candle": bar,
+                            "closed": closed,
+                        }
+                    )
+                if closed:
+                    result = self.engines[(symbol, timeframe)].update(bar)
+                    last_values.update_indicators(symbol, timeframe, result)
+                    if indicator_group(symbol, timeframe) in self.active:
+                        event = {"type": "market.indicators", "symbol": symbol, "tf": timeframe, "seq": next(self._seq)}
+                        streams.setdefault(indicator_group(symbol, timeframe), []).append({**event, **result})
+
+        # Text and binary events for a symbol carry the same ticks, so they share a sequence number.
+        sends = []
+        for symbol in ticks.keys() | binary.keys():
+            seq = next(self._seq)
+            if symbol in ticks:
+                event = {"type": "market.ticks", "symbol": symbol, "seq": seq, "ticks": ticks[symbol]}
+                sends.append(self._send(symbol_group(symbol), event))
+            if symbol in binary:
+                frame = encode_ticks(await symbol_ids.get(symbol), binary[symbol])
+                event = {"type": "market.frame", "symbol": symbol, "seq": seq, "frame": frame}
+                sends.append(self._send(binary_group(symbol), event))
+        sends.extend(self._send_all(group, events) for group, events in streams.items())
+        await asyncio.gather(*sends)
+        self.published += len(batch)
+
+        if self.share_snapshots and now - self._shared_at >= SHARED_SNAPSHOT_INTERVAL:
+            await publish_shared(last_values, self.aggregators)
+            self._shared_at = now
+
+    async def _send(self, group: str, message: dict) -> None:
+        async with self._semaphore:
+            await self.channel_layer.group_send(group, message)
+
+    async def _send_all(self, group: str, messages: list[dict]) -> None:
+        for message in messages:
+            await self._send(group, message)
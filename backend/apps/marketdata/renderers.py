@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import struct
+
+import numpy as np
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+COLUMNAR_MAGIC = b"MNGC"
+
+
+def _split(data):
+    if not isinstance(data, dict) or "columns" not in data:
+        return None, None
+    meta = {key: value for key, value in data.items() if key != "columns"}
+    return meta, data["columns"]
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, cls=JSONEncoder, separators=(",", ":"))
+
+
+def _jsonable(column) -> list:
+    # NaN (e.g. indicator warm-up bars) is not valid JSON; send null instead.
+    column = np.asarray(column)
+    if column.dtype.kind == "f" and np.isnan(column).any():
+        return np.where(np.isnan(column), None, column.astype(object)).tolist()
+    return column.tolist()
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        meta, columns = _split(data)
+        if meta is not None:
+            data = {**meta, "columns": {name: _jsonable(column) for name, column in columns.items()}}
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """One metadata object line followed by one ``[field, ...]`` array per row."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        meta, columns = _split(data)
+        if meta is None:
+            return _dumps(data).encode()
+
+        lines = [_dumps(meta)]
+        rows = zip(*(_jsonable(column) for column in columns.values()))
+        lines.extend(map(_dumps, rows))
+        return ("\n".join(lines) + "\n").encode()
+
+
+class ColumnarRenderer(BaseRenderer):
+    """Little-endian column blocks behind a small JSON header.
+
+    Layout: ``b"MNGC"``, uint32 header length, the JSON header (padded with
+    spaces to an 8 byte boundary), then each column listed in ``header["dtypes"]``
+    back to back so clients can wrap them in typed arrays without copying.
+    """
+
+    media_type = "application/vnd.mngfx.columns"
+    format = "columns"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        meta, columns = _split(data)
+        if meta is None:
+            return _dumps(data).encode()
+
+        arrays = [np.ascontiguousarray(column, dtype=column.dtype.newbyteorder("<")) for column in columns.values()]
+        meta["dtypes"] = {name: array.dtype.str for name, array in zip(columns, arrays)}
+        header = _dumps(meta).encode()
+        header += b" " * (-(len(COLUMNAR_MAGIC) + 4 + len(header)) % 8)
+        parts = [COLUMNAR_MAGIC, struct.pack("<I", len(header)), header]
+        parts.extend(array.tobytes() for array in arrays)
+        return b"".join(parts)
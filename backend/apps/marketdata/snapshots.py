@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+
+from django.conf import settings
+
+from .candles import bar_start
+from .subscriptions import market_cache
+
+
+RECENT_BARS = 50
+SHARED_KEY = "marketdata:snapshot:{symbol}"
+SHARED_TIMEOUT = 60 * 60
+FRESH_MS = 5_000
+
+
+class LastValueCache:
+    """Latest quote, recent bars and indicator values per symbol, kept in process memory.
+
+    Closed bars are held in a bounded deque per ``(symbol, timeframe)`` and the
+    open bar is tracked separately, so a snapshot is always the last
+    ``max_bars`` closed bars plus the bar in progress.
+    """
+
+    def __init__(self, max_bars: int = RECENT_BARS):
+        self.max_bars = max_bars
+        self.quotes: dict[str, dict] = {}
+        self.closed: dict[tuple[str, str], deque] = {}
+        self.open: dict[tuple[str, str], dict] = {}
+        self.indicators: dict[tuple[str, str], dict] = {}
+        self.applied: dict[tuple, int] = {}
+
+    def first_delivery(self, key: tuple, seq: int | None) -> bool:
+        """Whether event ``seq`` on ``key`` has not been applied in this process yet.
+
+        Every local subscriber of a group gets its own copy of each message; the
+        publisher's sequence number lets only the first copy update the cache.
+        Events without one are always applied.
+        """
+
+        if seq is None:
+            return True
+        if self.applied.get(key) == seq:
+            return False
+        self.applied[key] = seq
+        return True
+
+    def update_tick(self, tick: dict) -> None:
+        current = self.quotes.get(tick["symbol"])
+        if current is None or tick["ts"] >= current["ts"]:
+            self.quotes[tick["symbol"]] = tick
+
+    def update_candle(self, symbol: str, timeframe: str, candle: dict, closed: bool) -> None:
+        key = (symbol, timeframe)
+        if not closed:
+            current = self.open.get(key)
+            if current is None or candle["start"] >= current["start"]:
+                self.open[key] = candle
+            return
+
+        bars = self.closed.get(key)
+        if bars is None:
+            bars = self.closed[key] = deque(maxlen=self.max_bars)
+        if not bars or candle["start"] > bars[-1]["start"]:
+            bars.append(candle)
+        if key in self.open and self.open[key]["start"] <= candle["start"]:
+            del self.open[key]
+
+    def update_indicators(self, symbol: str, timeframe: str, result: dict) -> None:
+        current = self.indicators.get((symbol, timeframe))
+        if current is None or result["start"] >= current["start"]:
+            self.indicators[(symbol, timeframe)] = result
+
+    def bars(self, symbol: str, timeframe: str) -> list[dict]:
+        key = (symbol, timeframe)
+        bars = list(self.closed.get(key, ()))
+        if key in self.open:
+            bars.append(self.open[key])
+        return bars
+
+    def timeframes(self, symbol: str) -> list[str]:
+        return sorted({timeframe for key_symbol, timeframe in [*self.closed, *self.open] if key_symbol == symbol})
+
+    def snapshot(self, symbol: str, timeframes=None, indicator_timeframes=None) -> dict:
+        if timeframes is None:
+            timeframes = self.timeframes(symbol)
+        if indicator_timeframes is None:
+            indicator_timeframes = sorted(timeframe for key_symbol, timeframe in self.indicators if key_symbol == symbol)
+        candles = {timeframe: self.bars(symbol, timeframe) for timeframe in timeframes}
+        indicators = {timeframe: self.indicators.get((symbol, timeframe)) for timeframe in indicator_timeframes}
+        return {
+            "symbol": symbol,
+            "tick": self.quotes.get(symbol),
+            "candles": {timeframe: bars for timeframe, bars in candles.items() if bars},
+            "indicators": {timeframe: result for timeframe, result in indicators.items() if result},
+        }
+
+    def merge(self, snapshot: dict) -> None:
+        if snapshot.get("tick"):
+            self.update_tick(snapshot["tick"])
+        for timeframe, bars in (snapshot.get("candles") or {}).items():
+            if not bars:
+                continue
+            for bar in bars[:-1]:
+                self.update_candle(snapshot["symbol"], timeframe, bar, True)
+            self.update_candle(snapshot["symbol"], timeframe, bars[-1], False)
+        for timeframe, result in (snapshot.get("indicators") or {}).items():
+            self.update_indicators(snapshot["symbol"], timeframe, result)
+
+
+def shared_snapshots_enabled() -> bool:
+    return getattr(settings, "MARKETDATA_SHARED_SNAPSHOTS", True)
+
+
+async def publish_shared(lvc: LastValueCache, symbols) -> None:
+    """Copy snapshots into the market data cache for consumers running in other processes."""
+
+    await market_cache.aset_many(
+        {SHARED_KEY.format(symbol=symbol): lvc.snapshot(symbol) for symbol in symbols if symbol in lvc.quotes},
+        timeout=SHARED_TIMEOUT,
+    )
+
+
+def is_fresh(snapshot: dict, timeframes, now: int | None = None) -> bool:
+    """Whether a local snapshot is current, i.e. this process has been receiving the symbol."""
+
+    tick = snapshot["tick"]
+    now = int(time.time() * 1000) if now is None else now
+    if tick is None or now - tick["ts"] > FRESH_MS:
+        return False
+    for timeframe in timeframes:
+        bars = snapshot["candles"].get(timeframe)
+        if not bars or bars[-1]["start"] != bar_start(tick["ts"], timeframe):
+            return False
+    return True
+
+
+async def load_snapshot(symbol: str, timeframes, indicator_timeframes=()) -> dict:
+    """Snapshot from this process, topped up from the shared copy when it is stale."""
+
+    snapshot = last_values.snapshot(symbol, timeframes, indicator_timeframes)
+    fresh = is_fresh(snapshot, timeframes) and all(timeframe in snapshot["indicators"] for timeframe in indicator_timeframes)
+    if fresh or not shared_snapshots_enabled():
+        return snapshot
+
+    shared = await market_cache.aget(SHARED_KEY.format(symbol=symbol))
+    if not shared:
+        return snapshot
+    last_values.merge(shared)
+    return last_values.snapshot(symbol, timeframes, indicator_timeframes)
+
+
+last_values = LastValueCache()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+from django.conf import settings
+
+
+# One fixed-width record per tick: 24 bytes, no per-row overhead.
+TICK_DTYPE = np.dtype([("ts", "<i8"), ("bid", "<f8"), ("ask", "<f8")])
+SEGMENT_SUFFIX = ".ticks"
+DAY_MS = 24 * 60 * 60 * 1000
+EPOCH = date(1970, 1, 1)
+
+
+def day_of(ts: int) -> date:
+    return EPOCH + timedelta(days=ts // DAY_MS)
+
+
+class TickStore:
+    """Append-only tick history stored as one segment file per symbol per UTC day.
+
+    Segments are raw ``TICK_DTYPE`` records written in arrival (timestamp)
+    order, so reads can memory-map a segment and binary-search the requested
+    range. Query results are numpy views over the mapped file, not copies.
+    """
+
+    def __init__(self, root=None):
+        self.root = Path(root or settings.MARKETDATA_TICK_DIR)
+
+    def segment_path(self, symbol: str, day: date) -> Path:
+        return self.root / symbol / f"{day.isoformat()}{SEGMENT_SUFFIX}"
+
+    def append(self, symbol: str, rows: np.ndarray) -> None:
+        """Append ``TICK_DTYPE`` rows (sorted by ``ts``) to the matching day segments."""
+
+        if len(rows) == 0:
+            return
+        rows = np.asarray(rows, dtype=TICK_DTYPE)
+        days = rows["ts"] // DAY_MS
+        boundaries = np.flatnonzero(np.diff(days)) + 1
+        for chunk in np.split(rows, boundaries):
+            path = self.segment_path(symbol, day_of(int(chunk["ts"][0])))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as handle:
+                handle.write(chunk.tobytes())
+
+    def symbols(self) -> list[str]:
+        if not self.root.exists():
+            return []
+        return sorted(path.name for path in self.root.iterdir() if path.is_dir())
+
+    def segments(self, symbol: str, start: int, end: int) -> list[Path]:
+        paths = []
+        day, last = day_of(start), day_of(end)
+        while day <= last:
+            path = self.segment_path(symbol, day)
+            if path.exists():
+                paths.append(path)
+            day += timedelta(days=1)
+        return paths
+
+    def open_segment(self, path: Path) -> np.ndarray:
+        # A torn trailing record from an interrupted write is ignored.
+        count = path.stat().st_size // TICK_DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        return np.memmap(path, dtype=TICK_DTYPE, mode="r", shape=(count,))
+
+    def iter_range(self, symbol: str, start: int, end: int) -> Iterator[np.ndarray]:
+        """Yield memory-mapped slices of each segment covering ``start <= ts < end``."""
+
+        for path in self.segments(symbol, start, end):
+            segment = self.open_segment(path)
+            ts = segment["ts"]
+            lo = int(np.searchsorted(ts, start, side="left"))
+            hi = int(np.searchsorted(ts, end, side="left"))
+            if hi > lo:
+                yield segment[lo:hi]
+
+    def query(self, symbol: str, start: int, end: int, limit: int | None = None) -> np.ndarray:
+        """Ticks in ``start <= ts < end``; with ``limit`` only the first ``limit`` rows.
+
+        Segments are visited in order and the walk stops once ``limit`` rows are
+        collected, so a capped query over a long range copies at most that much.
+        """
+
+        parts, remaining = [], limit
+        for part in self.iter_range(symbol, start, end):
+            if remaining is not None:
+                part = part[:remaining]
+                remaining -= len(part)
+            parts.append(part)
+            if remaining == 0:
+                break
+        if not parts:
+            return np.empty(0, dtype=TICK_DTYPE)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+
+class TickWriter:
+    """Buffers ticks per symbol and appends them to a ``TickStore`` in blocks."""
+
+    def __init__(self, store: TickStore | None = None, flush_rows: int = 1000):
+        self.store = store or TickStore()
+        self.flush_rows = flush_rows
+        self._pending: dict[str, list] = defaultdict(list)
+        self._count = 0
+
+    def add(self, tick: dict) -> None:
+        self._pending[tick["symbol"]].append((tick["ts"], tick["bid"], tick["ask"]))
+        self._count += 1
+        if self._count >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, defaultdict(list)
+        self._count = 0
+        for symbol, rows in pending.items():
+            self.store.append(symbol, np.array(rows, dtype=TICK_DTYPE))
+
+    def close(self) -> None:
+        self.flush()
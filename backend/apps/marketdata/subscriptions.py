@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.connection import ConnectionProxy
+
+
+GROUP_PREFIX = "market."
+BINARY_GROUP_PREFIX = "market-bin."
+CANDLE_GROUP_PREFIX = "candles."
+INDICATOR_GROUP_PREFIX = "indicators."
+SYMBOL_PATTERN = re.compile(r"^[A-Z0-9]{3,12}$")
+SUBSCRIBER_KEY = "marketdata:subscribers:{group}"
+
+# Shared between every worker and the publisher; see settings.MARKETDATA_CACHE.
+market_cache = ConnectionProxy(caches, settings.MARKETDATA_CACHE)
+
+
+def normalize_symbol(raw) -> str | None:
+    if not isinstance(raw, str):
+        return None
+    symbol = raw.strip().upper().replace("/", "")
+    return symbol if SYMBOL_PATTERN.match(symbol) else None
+
+
+def symbol_group(symbol: str) -> str:
+    return f"{GROUP_PREFIX}{symbol}"
+
+
+def binary_group(symbol: str) -> str:
+    """Group of connections that negotiated binary tick frames for ``symbol``."""
+
+    return f"{BINARY_GROUP_PREFIX}{symbol}"
+
+
+def candle_group(symbol: str, timeframe: str) -> str:
+    return f"{CANDLE_GROUP_PREFIX}{symbol}.{timeframe}"
+
+
+def indicator_group(symbol: str, timeframe: str) -> str:
+    return f"{INDICATOR_GROUP_PREFIX}{symbol}.{timeframe}"
+
+
+def requested_symbols(content: dict, default: str | None = None) -> list[str]:
+    """Collect the symbols named by a ``symbol`` or ``symbols`` field of a client message."""
+
+    raw = content.get("symbols")
+    if raw is None:
+        raw = [content.get("symbol", default)]
+    elif isinstance(raw, str):
+        raw = raw.split(",")
+    elif not isinstance(raw, (list, tuple)):
+        raw = []
+
+    symbols: list[str] = []
+    for item in raw:
+        symbol = normalize_symbol(item)
+        if symbol and symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+class SubscriptionRegistry:
+    """Per-group subscriber counts kept in the market data cache.
+
+    Consumers bump the count when a socket joins a market group and drop it again
+    on unsubscribe/disconnect, so publishers can skip groups nobody is watching.
+    With the Redis cache the counts are shared by every worker process.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or market_cache
+
+    def _key(self, group: str) -> str:
+        return SUBSCRIBER_KEY.format(group=group)
+
+    async def add(self, group: str) -> None:
+        key = self._key(group)
+        await self.backend.aadd(key, 0, timeout=None)
+        await self.backend.aincr(key)
+
+    async def remove(self, group: str) -> None:
+        key = self._key(group)
+        try:
+            remaining = await self.backend.adecr(key)
+        except ValueError:
+            return
+        if remaining <= 0:
+            await self.backend.adelete(key)
+
+    def active(self, groups: Iterable[str]) -> list[str]:
+        groups = list(groups)
+        counts = self.backend.get_many([self._key(group) for group in groups])
+        return [group for group in groups if counts.get(self._key(group), 0) > 0]
+
+    async def aactive(self, groups: Iterable[str]) -> list[str]:
+        groups = list(groups)
+        counts = await self.backend.aget_many([self._key(group) for group in groups])
+        return [group for group in groups if counts.get(self._key(group), 0) > 0]
+
+
+registry = SubscriptionRegistry()
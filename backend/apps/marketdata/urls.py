@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import history
+
+
+urlpatterns = [
+    path("history/", history, name="market-history"),
+]
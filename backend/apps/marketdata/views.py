@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+from django.utils.dateparse import parse_datetime
+from rest_framework.decorators import api_view, renderer_classes
+from rest_framework.response import Response
+
+from .candles import CANDLE_FIELDS, TIMEFRAMES, normalize_timeframe, resample
+from .indicators import INDICATOR_PATTERN, compute, parse_indicators, swings
+from .renderers import ColumnarJSONRenderer, ColumnarRenderer, NDJSONRenderer
+from .storage import DAY_MS, TickStore
+from .subscriptions import normalize_symbol
+
+
+TICK_TIMEFRAME = "tick"
+TICK_FIELDS = ("ts", "bid", "ask")
+MAX_TICK_ROWS = 200_000
+MAX_RANGE_MS = 366 * DAY_MS
+DEFAULT_BARS = 500
+SWINGS = "swings"
+# Extra bars loaded before ``from`` per unit of the longest indicator period (weekends leave gaps).
+WARMUP_FACTOR = 2
+
+
+def _parse_time(raw):
+    if raw in (None, ""):
+        return None
+    if raw.lstrip("-").isdigit():
+        return int(raw)
+    parsed = parse_datetime(raw)
+    if parsed is None:
+        raise ValueError(raw)
+    return int(parsed.timestamp() * 1000)
+
+
+def _candle_columns(store, symbol, start, end, timeframe):
+    # Every timeframe divides a UTC day, so bars never straddle two day segments.
+    chunks = [resample(segment["ts"], segment["bid"], timeframe) for segment in store.iter_range(symbol, start, end)]
+    if not chunks:
+        return resample(np.empty(0, dtype=np.int64), np.empty(0), timeframe)
+    return {field: np.concatenate([chunk[field] for chunk in chunks]) for field in CANDLE_FIELDS}
+
+
+def _indicator_columns(store, symbol, start, end, timeframe, indicators, with_swings):
+    longest = max((int(INDICATOR_PATTERN.match(name).group(2)) for name in indicators), default=0)
+    warmup = TIMEFRAMES[timeframe] * longest * WARMUP_FACTOR
+    columns = _candle_columns(store, symbol, start - warmup, end, timeframe)
+    columns.update(compute(indicators, columns))
+    if with_swings:
+        columns["swing_high"], columns["swing_low"] = swings(columns["high"], columns["low"])
+    first = int(np.searchsorted(columns["start"], start, side="left"))
+    return {name: column[first:] for name, column in columns.items()}
+
+
+def _tick_columns(store, symbol, start, end):
+    ticks = store.query(symbol, start, end, limit=MAX_TICK_ROWS)
+    return {field: np.ascontiguousarray(ticks[field]) for field in TICK_FIELDS}
+
+
+@api_view(["GET"])
+@renderer_classes([ColumnarJSONRenderer, NDJSONRenderer, ColumnarRenderer])
+def history(request):
+    symbol = normalize_symbol(request.query_params.get("symbol") or "")
+    if not symbol:
+        return Response({"error": "symbol is required"}, status=400)
+
+    raw_timeframe = request.query_params.get("tf") or "1m"
+    timeframe = TICK_TIMEFRAME if raw_timeframe == TICK_TIMEFRAME else normalize_timeframe(raw_timeframe)
+    if timeframe is None:
+        return Response({"error": f"tf must be one of {', '.join([*TIMEFRAMES, TICK_TIMEFRAME])}"}, status=400)
+
+    try:
+        end = _parse_time(request.query_params.get("to"))
+        start = _parse_time(request.query_params.get("from"))
+    except ValueError:
+        return Response({"error": "from/to must be epoch milliseconds or ISO 8601 datetimes"}, status=400)
+
+    if end is None:
+        end = int(time.time() * 1000)
+    if start is None:
+        start = end - (DAY_MS if timeframe == TICK_TIMEFRAME else TIMEFRAMES[timeframe] * DEFAULT_BARS)
+    if start >= end:
+        return Response({"error": "from must be before to"}, status=400)
+    if end - start > MAX_RANGE_MS:
+        return Response({"error": "requested range is longer than one year"}, status=400)
+
+    requested = [name.strip().lower() for name in (request.query_params.get("indicators") or "").split(",") if name.strip()]
+    with_swings = SWINGS in requested
+    indicators = parse_indicators([name for name in requested if name != SWINGS])
+    if indicators is None:
+        return Response({"error": "indicators must be sma<n>, ema<n>, atr<n>, rsi<n> or swings"}, status=400)
+    if (indicators or with_swings) and timeframe == TICK_TIMEFRAME:
+        return Response({"error": "indicators need a candle timeframe"}, status=400)
+
+    store = TickStore()
+    if timeframe == TICK_TIMEFRAME:
+        columns = _tick_columns(store, symbol, start, end)
+    elif indicators or with_swings:
+        columns = _indicator_columns(store, symbol, start, end, timeframe, indicators, with_swings)
+    else:
+        columns = _candle_columns(store, symbol, start, end, timeframe)
+
+    count = len(next(iter(columns.values())))
+    return Response(
+        {
+            "symbol": symbol,
+            "tf": timeframe,
+            "from": start,
+            "to": end,
+            "count": count,
+            "truncated": timeframe == TICK_TIMEFRAME and count >= MAX_TICK_ROWS,
+            "fields": list(columns),
+            "columns": columns,
+        }
+    )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import struct
+from collections import deque
+from urllib.parse import parse_qs
+
+from .delivery import LATEST, MAX_BATCH_TICKS
+from .subscriptions import market_cache
+
+
+JSON = "json"
+BINARY = "binary"
+ENCODINGS = (JSON, BINARY)
+
+SYMBOL_ID_KEY = "marketdata:symbol-id:{symbol}"
+SYMBOL_COUNTER_KEY = "marketdata:symbol-ids"
+
+TICKS_FRAME = 1
+# Frame: kind (u8), padding, symbol id (u16), record count (u32), then the
+# records. Records match storage.TICK_DTYPE: ts (i64 ms), bid (f64), ask (f64).
+FRAME_HEADER = struct.Struct("<BxHI")
+TICK_RECORD = struct.Struct("<qdd")
+
+
+def parse_encoding(scope: dict) -> str | None:
+    """Read ``?encoding=json|binary`` from the websocket URL; ``None`` if unknown."""
+
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    encoding = (query.get("encoding") or [JSON])[-1].lower()
+    return encoding if encoding in ENCODINGS else None
+
+
+class SymbolTable:
+    """Small integer ids for symbols, shared through the market data cache.
+
+    Binary frames carry the id instead of the symbol name; clients learn the
+    mapping from the ``subscribed`` reply. Ids are allocated once and never
+    reused, and with Redis behind that cache every publisher and worker agrees on them.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or market_cache
+        self._ids: dict[str, int] = {}
+
+    async def get(self, symbol: str) -> int:
+        symbol_id = self._ids.get(symbol)
+        if symbol_id is not None:
+            return symbol_id
+
+        key = SYMBOL_ID_KEY.format(symbol=symbol)
+        symbol_id = await self.backend.aget(key)
+        if symbol_id is None:
+            await self.backend.aadd(SYMBOL_COUNTER_KEY, 0, timeout=None)
+            await self.backend.aadd(key, await self.backend.aincr(SYMBOL_COUNTER_KEY), timeout=None)
+            # Another process may have claimed the symbol first; its id wins.
+            symbol_id = await self.backend.aget(key)
+        self._ids[symbol] = symbol_id
+        return symbol_id
+
+
+def encode_ticks(symbol_id: int, ticks: list[dict]) -> bytes:
+    parts = [FRAME_HEADER.pack(TICKS_FRAME, symbol_id, len(ticks))]
+    parts.extend(TICK_RECORD.pack(tick["ts"], tick["bid"], tick["ask"]) for tick in ticks)
+    return b"".join(parts)
+
+
+def frame_records(frame: bytes) -> list[bytes]:
+    body = memoryview(frame)[FRAME_HEADER.size:]
+    size = TICK_RECORD.size
+    return [body[offset:offset + size] for offset in range(0, len(body), size)]
+
+
+def last_tick(symbol: str, frame: bytes) -> dict:
+    ts, bid, ask = TICK_RECORD.unpack_from(frame, len(frame) - TICK_RECORD.size)
+    return {"symbol": symbol, "ts": ts, "bid": bid, "ask": ask}
+
+
+class FrameBuffer:
+    """Binary counterpart of :class:`~apps.marketdata.delivery.TickBuffer`.
+
+    Keeps the already-encoded records from published frames and re-frames them
+    on flush, one frame per symbol in a single websocket message, so buffered
+    delivery never encodes a tick again.
+    """
+
+    def __init__(self, mode: str):
+        self.maxlen = 1 if mode == LATEST else MAX_BATCH_TICKS
+        self._pending: dict[int, deque] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def add(self, frame: bytes) -> None:
+        _, symbol_id, _ = FRAME_HEADER.unpack_from(frame)
+        records = self._pending.get(symbol_id)
+        if records is None:
+            records = self._pending[symbol_id] = deque(maxlen=self.maxlen)
+        records.extend(frame_records(frame))
+
+    def drain(self) -> bytes | None:
+        if not self._pending:
+            return None
+
+        pending, self._pending = self._pending, {}
+        parts = []
+        for symbol_id, records in pending.items():
+            parts.append(FRAME_HEADER.pack(TICKS_FRAME, symbol_id, len(records)))
+            parts.extend(records)
+        return b"".join(parts)
+
+
+symbol_ids = SymbolTable()
@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.resources.models import ChunkedUpload
+
+
+class Command(BaseCommand):
+    help = "Delete chunked uploads (and their partial files) that were started more than --older-than hours ago."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than", type=int, default=24)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        if options["older_than"] <= 0:
+            raise CommandError("--older-than must be positive.")
+
+        stale = ChunkedUpload.objects.filter(created_at__lt=timezone.now() - timedelta(hours=options["older_than"]))
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"Would remove {stale.count()} uploads."))
+            return
+        # Deleting row by row lets the post_delete receiver remove each partial file.
+        removed = 0
+        for upload in stale.iterator():
+            upload.delete()
+            removed += 1
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} uploads."))
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:11
+
+import apps.blobs.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0003_chunkedupload'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='resource',
+            name='file',
+            field=models.FileField(blank=True, null=True, storage=apps.blobs.storage.get_blob_storage, upload_to='resources/documents/'),
+        ),
+    ]
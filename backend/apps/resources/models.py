@@ -1,6 +1,13 @@
+import uuid
+
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.blobs.models import track_blobs
+from apps.blobs.storage import get_blob_storage
 
 
 class Resource(models.Model):
@@ -14,7 +21,7 @@ class Resource(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     resource_type = models.CharField(max_length=20, choices=RESOURCE_TYPES)
-    file = models.FileField(upload_to="resources/documents/", blank=True, null=True)
+    file = models.FileField(upload_to="resources/documents/", storage=get_blob_storage, blank=True, null=True)
     video_url = models.URLField(blank=True)
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="resources")
     created_at = models.DateTimeField(auto_now_add=True)
@@ -22,6 +29,7 @@ class Resource(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["created_by", "-created_at", "-id"], name="resource_owner_created_idx")]
 
     def clean(self):
         if self.resource_type == self.DOCUMENT and not self.file:
@@ -36,3 +44,29 @@ class Resource(models.Model):
     def __str__(self) -> str:
         return f"{self.get_resource_type_display()} • {self.title}"
 
+
+track_blobs(Resource, "file")
+
+
+class ChunkedUpload(models.Model):
+    """A resource file being uploaded in chunks; the bytes live in a ``.part`` file until finalize."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="chunked_uploads")
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    sha256 = models.CharField(max_length=64, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.filename} ({self.size} bytes)"
+
+
+@receiver(post_delete, sender=ChunkedUpload)
+def discard_upload_part(sender, instance, **kwargs):
+    from .uploads import discard
+
+    discard(instance)
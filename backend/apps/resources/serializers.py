@@ -1,9 +1,15 @@
+import re
+
+from django.conf import settings
 from rest_framework import serializers
 
-from .models import Resource
+from mngfx_backend.serializers import SparseFieldsetMixin
+
+from .models import ChunkedUpload, Resource
+from .uploads import received
 
 
-class ResourceSerializer(serializers.ModelSerializer):
+class ResourceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     created_by_name = serializers.CharField(source="created_by.first_name", read_only=True)
 
     class Meta:
@@ -39,3 +45,25 @@ class ResourceSerializer(serializers.ModelSerializer):
             validated_data["created_by"] = request.user
         return super().create(validated_data)
 
+
+class ChunkedUploadSerializer(serializers.ModelSerializer):
+    offset = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ChunkedUpload
+        fields = ["id", "filename", "size", "sha256", "offset", "created_at"]
+        read_only_fields = ["id", "offset", "created_at"]
+
+    def get_offset(self, obj) -> int:
+        return received(obj)
+
+    def validate_size(self, value):
+        if not 0 < value <= settings.RESOURCE_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(f"Size must be between 1 and {settings.RESOURCE_UPLOAD_MAX_SIZE} bytes.")
+        return value
+
+    def validate_sha256(self, value):
+        value = value.lower()
+        if value and not re.fullmatch(r"[0-9a-f]{64}", value):
+            raise serializers.ValidationError("Expected a hex SHA-256 digest.")
+        return value
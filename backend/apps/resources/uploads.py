@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+
+
+BLOCK_SIZE = 64 * 1024
+MAX_HASHERS = 256
+
+
+class UploadBusy(Exception):
+    """Another request is still writing a chunk of the same upload."""
+
+
+class OffsetMismatch(Exception):
+    def __init__(self, offset: int):
+        super().__init__(offset)
+        self.offset = offset
+
+
+# Running SHA-256 per upload in this process, keyed by id, with the offset it covers.
+_hashers: OrderedDict = OrderedDict()
+_hashers_lock = threading.Lock()
+
+
+def part_path(upload) -> Path:
+    return Path(settings.RESOURCE_UPLOAD_DIR) / f"{upload.pk}.part"
+
+
+def received(upload) -> int:
+    """Bytes stored so far; the ``.part`` file itself is the source of truth."""
+
+    try:
+        return part_path(upload).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _take_hasher(upload, offset: int):
+    with _hashers_lock:
+        entry = _hashers.pop(upload.pk, None)
+    if entry is not None and entry[0] == offset:
+        return entry[1]
+
+    # Resumed on another worker or after a restart: rehash what is on disk once.
+    hasher = hashlib.sha256()
+    try:
+        with open(part_path(upload), "rb") as handle:
+            for block in iter(lambda: handle.read(BLOCK_SIZE), b""):
+                hasher.update(block)
+    except FileNotFoundError:
+        pass
+    return hasher
+
+
+def _keep_hasher(upload, offset: int, hasher) -> None:
+    with _hashers_lock:
+        _hashers[upload.pk] = (offset, hasher)
+        while len(_hashers) > MAX_HASHERS:
+            _hashers.popitem(last=False)
+
+
+def append(upload, stream, offset: int, length: int) -> int:
+    """Append ``length`` bytes read from ``stream`` at ``offset``; returns the new offset.
+
+    The body is copied to disk in small blocks and hashed on the way. Under
+    ASGI the server has already spooled the whole chunk (to a temporary file
+    above ``FILE_UPLOAD_MAX_MEMORY_SIZE``) before the view runs, so a chunk
+    whose connection drops is lost as a whole; the client asks for the stored
+    offset and sends it again.
+    """
+
+    path = part_path(upload)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab") as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadBusy from None
+
+        current = os.fstat(handle.fileno()).st_size
+        if current != offset:
+            raise OffsetMismatch(current)
+
+        hasher = _take_hasher(upload, current)
+        remaining = length
+        try:
+            while remaining:
+                block = stream.read(min(BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                handle.write(block)
+                hasher.update(block)
+                remaining -= len(block)
+        finally:
+            handle.flush()
+            current += length - remaining
+            _keep_hasher(upload, current, hasher)
+    return current
+
+
+def digest(upload) -> str:
+    offset = received(upload)
+    hasher = _take_hasher(upload, offset)
+    _keep_hasher(upload, offset, hasher)
+    return hasher.hexdigest()
+
+
+def discard(upload) -> None:
+    with _hashers_lock:
+        _hashers.pop(upload.pk, None)
+    part_path(upload).unlink(missing_ok=True)
+
+
+class AssembledUpload(UploadedFile):
+    """A finished ``.part`` file posing as an uploaded file.
+
+    Exposing ``temporary_file_path`` lets the storage move it into place
+    instead of copying it, like Django's own temporary uploads, and ``sha256``
+    spares the content-addressed storage a second pass over the file.
+    """
+
+    def __init__(self, upload):
+        self.path = part_path(upload)
+        content_type = mimetypes.guess_type(upload.filename)[0] or "application/octet-stream"
+        super().__init__(open(self.path, "rb"), upload.filename, content_type, upload.size)
+        self.sha256 = digest(upload)
+
+    def temporary_file_path(self) -> str:
+        return str(self.path)
@@ -1,10 +1,12 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import ResourceViewSet
+from .views import ChunkedUploadViewSet, ResourceViewSet
 
 
 router = DefaultRouter()
+# Registered first so "uploads/" is not taken for a resource id.
+router.register(r"uploads", ChunkedUploadViewSet, basename="resource-upload")
 router.register(r"", ResourceViewSet, basename="resource")
 
 
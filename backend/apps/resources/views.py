@@ -1,7 +1,18 @@
-from rest_framework import permissions, viewsets
+import os
 
-from .models import Resource
-from .serializers import ResourceSerializer
+from django.conf import settings
+from django.utils.text import slugify
+from rest_framework import mixins, permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from .downloads import serve_file
+from .models import ChunkedUpload, Resource
+from .serializers import ChunkedUploadSerializer, ResourceSerializer
+from .uploads import AssembledUpload, OffsetMismatch, UploadBusy, append, digest, received
+
+
+RESOURCE_FIELDS = ("title", "description", "resource_type", "video_url")
 
 
 class ResourceViewSet(viewsets.ModelViewSet):
@@ -14,3 +25,84 @@ class ResourceViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
+    @action(detail=True, methods=["get"])
+    def download(self, request, pk=None):
+        resource = self.get_object()
+        if not resource.file:
+            return Response({"error": "This resource has no file."}, status=404)
+        # Stored names are content hashes; name the download after the resource.
+        extension = os.path.splitext(resource.file.name)[1]
+        return serve_file(request, resource.file, filename=f"{slugify(resource.title) or 'resource'}{extension}")
+
+
+class ChunkedUploadViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    """Resumable resource uploads.
+
+    ``POST`` declares the file, each ``PUT`` appends the raw request body at the
+    ``Upload-Offset`` header, ``GET``/``HEAD`` report the stored offset to resume
+    from, and ``POST .../finalize/`` validates the file through
+    :class:`ResourceSerializer` and creates the resource.
+    """
+
+    serializer_class = ChunkedUploadSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return ChunkedUpload.objects.filter(owner=self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(owner=self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        response["Upload-Offset"] = response.data["offset"]
+        return response
+
+    def update(self, request, pk=None):
+        upload = self.get_object()
+        try:
+            offset = int(request.headers["Upload-Offset"])
+        except (KeyError, ValueError):
+            return Response({"error": "Upload-Offset header is required."}, status=400)
+
+        length = int(request.META.get("CONTENT_LENGTH") or 0)
+        if length > settings.RESOURCE_UPLOAD_CHUNK_SIZE:
+            return Response(
+                {"error": f"Chunks are limited to {settings.RESOURCE_UPLOAD_CHUNK_SIZE} bytes."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        if offset + length > upload.size:
+            return Response({"error": "Chunk runs past the declared file size."}, status=400)
+
+        # The raw body is copied in blocks; request.data is never parsed.
+        try:
+            offset = append(upload, request.stream, offset, length)
+        except OffsetMismatch as exc:
+            return Response({"error": "Offset does not match the stored upload.", "offset": exc.offset}, status=409)
+        except UploadBusy:
+            return Response({"error": "Another chunk of this upload is still being written."}, status=409)
+        return Response({"offset": offset}, headers={"Upload-Offset": str(offset)})
+
+    @action(detail=True, methods=["post"])
+    def finalize(self, request, pk=None):
+        upload = self.get_object()
+        offset = received(upload)
+        if offset != upload.size:
+            return Response({"error": "Upload is incomplete.", "offset": offset}, status=409)
+        if upload.sha256 and digest(upload) != upload.sha256:
+            upload.delete()
+            return Response({"error": "Checksum mismatch; the upload was discarded."}, status=400)
+
+        data = {field: request.data[field] for field in RESOURCE_FIELDS if field in request.data}
+        data.setdefault("resource_type", Resource.DOCUMENT)
+        with AssembledUpload(upload) as file:
+            serializer = ResourceSerializer(data={**data, "file": file}, context=self.get_serializer_context())
+            serializer.is_valid(raise_exception=True)
+            serializer.save(created_by=request.user)
+        upload.delete()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
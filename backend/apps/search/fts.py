@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save
+
+
+TERM_PATTERN = re.compile(r"\w+")
+REBUILD_BATCH = 500
+
+
+def terms(text: str, limit: int, stopwords=frozenset()) -> list[str]:
+    """Distinct lowercase words of ``text`` in order, minus ``stopwords``, at most ``limit``."""
+
+    found = []
+    for term in TERM_PATTERN.findall((text or "").lower()):
+        if term not in stopwords and term not in found:
+            found.append(term)
+    return found[:limit]
+
+
+def quoted(term: str) -> str:
+    # Terms only hold word characters, so quoting makes them plain FTS5 strings.
+    return f'"{term}"'
+
+
+class FTSTable:
+    """Writes to one FTS5 table whose rows are addressed by rowid ranges.
+
+    Callers give each indexed object a fixed block of rowids, so replacing or
+    dropping its rows is a rowid range delete rather than a scan of the
+    UNINDEXED columns.
+    """
+
+    def __init__(self, name: str, columns: Iterable[str]):
+        self.name = name
+        self.columns = tuple(columns)
+        placeholders = ", ".join(["%s"] * (len(self.columns) + 1))
+        self.insert_sql = f"INSERT INTO {name} (rowid, {', '.join(self.columns)}) VALUES ({placeholders})"
+        self.delete_sql = f"DELETE FROM {name} WHERE rowid >= %s AND rowid < %s"
+
+    def replace(self, first: int, stop: int, rows: list[tuple]) -> None:
+        """Swap the rows in ``first <= rowid < stop`` for ``rows`` (each starting with its rowid)."""
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(self.delete_sql, [first, stop])
+            cursor.executemany(self.insert_sql, rows)
+
+    def delete(self, first: int, stop: int) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(self.delete_sql, [first, stop])
+
+    def rebuild(self, rows: Iterable[tuple], batch_size: int = REBUILD_BATCH) -> int:
+        """Replace the whole table with ``rows`` in one transaction; returns the row count."""
+
+        count = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.name}")
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    cursor.executemany(self.insert_sql, batch)
+                    count += len(batch)
+                    batch = []
+            cursor.executemany(self.insert_sql, batch)
+            count += len(batch)
+            cursor.execute(f"INSERT INTO {self.name} ({self.name}) VALUES ('optimize')")
+        return count
+
+
+def keep_indexed(models, index, remove) -> None:
+    """Call ``index(instance)`` after each save and ``remove(instance)`` after each delete of ``models``."""
+
+    def saved(sender, instance, raw=False, **kwargs):
+        if not raw:
+            index(instance)
+
+    def deleted(sender, instance, **kwargs):
+        remove(instance)
+
+    for model in models:
+        uid = f"{index.__module__}:{model._meta.label}"
+        post_save.connect(saved, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(deleted, sender=model, weak=False, dispatch_uid=uid)
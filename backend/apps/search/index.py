@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import html
+
+from django.db import connection
+
+from .fts import FTSTable, quoted, terms
+
+
+TABLE = "search_document"
+COURSE = "course"
+LESSON = "lesson"
+RESOURCE = "resource"
+KINDS = (COURSE, LESSON, RESOURCE)
+# rowid = object id * 8 + kind code, so one object maps to one row without a lookup.
+KIND_CODES = {COURSE: 1, LESSON: 2, RESOURCE: 3}
+ROWID_STRIDE = 8
+
+MAX_TERMS = 12
+SNIPPET_TOKENS = 16
+# Highlight markers that cannot occur in stored text; swapped for <mark> after escaping.
+MARK_OPEN = "\x02"
+MARK_CLOSE = "\x03"
+
+table = FTSTable(TABLE, ("title", "body", "kind", "object_id", "course_id", "owner_id"))
+
+
+def rowid(kind: str, pk: int) -> int:
+    return pk * ROWID_STRIDE + KIND_CODES[kind]
+
+
+def document(instance) -> tuple[str, dict] | None:
+    """The indexed fields for a course, lesson or resource; ``None`` for other models."""
+
+    from apps.courses.models import Course, Lesson
+    from apps.resources.models import Resource
+
+    if isinstance(instance, Course):
+        return COURSE, {"title": instance.title, "body": instance.description, "course_id": instance.pk}
+    if isinstance(instance, Lesson):
+        return LESSON, {"title": instance.title, "body": instance.content, "course_id": instance.course_id}
+    if isinstance(instance, Resource):
+        return RESOURCE, {"title": instance.title, "body": instance.description, "owner_id": instance.created_by_id}
+    return None
+
+
+def _row(kind: str, pk: int, fields: dict) -> tuple:
+    return (
+        rowid(kind, pk),
+        fields["title"],
+        fields["body"] or "",
+        kind,
+        pk,
+        fields.get("course_id"),
+        fields.get("owner_id"),
+    )
+
+
+def index_object(instance) -> None:
+    kind, fields = document(instance)
+    row = _row(kind, instance.pk, fields)
+    table.replace(row[0], row[0] + 1, [row])
+
+
+def remove_object(instance) -> None:
+    kind, _ = document(instance)
+    first = rowid(kind, instance.pk)
+    table.delete(first, first + 1)
+
+
+def _all_rows(batch_size: int):
+    from apps.courses.models import Course, Lesson
+    from apps.resources.models import Resource
+
+    querysets = (
+        Course.objects.only("pk", "title", "description"),
+        Lesson.objects.only("pk", "title", "content", "course_id"),
+        Resource.objects.only("pk", "title", "description", "created_by_id"),
+    )
+    for queryset in querysets:
+        for instance in queryset.order_by().iterator(chunk_size=batch_size):
+            kind, fields = document(instance)
+            yield _row(kind, instance.pk, fields)
+
+
+def rebuild(batch_size: int = 500) -> int:
+    """Re-index every course, lesson and resource from scratch; returns the row count."""
+
+    return table.rebuild(_all_rows(batch_size), batch_size)
+
+
+def match_expression(query: str) -> str | None:
+    """Turn free text into a safe FTS5 query: every term required, the last one as a prefix."""
+
+    words = [quoted(term) for term in terms(query, MAX_TERMS)]
+    if not words:
+        return None
+    words[-1] += "*"
+    return " ".join(words)
+
+
+def _marked(text: str) -> str:
+    return html.escape(text).replace(MARK_OPEN, "<mark>").replace(MARK_CLOSE, "</mark>")
+
+
+def search(query: str, user_id: int | None = None, kinds=KINDS, limit: int = 20, offset: int = 0) -> list[dict]:
+    """BM25-ranked matches with highlighted titles and snippets (HTML-escaped, ``<mark>`` tags).
+
+    Courses and lessons are visible to everyone; resources only to their owner.
+    """
+
+    expression = match_expression(query)
+    if expression is None or not kinds:
+        return []
+
+    kind_placeholders = ", ".join(["%s"] * len(kinds))
+    sql = f"""
+        SELECT kind, object_id, course_id,
+               highlight({TABLE}, 0, %s, %s),
+               snippet({TABLE}, 1, %s, %s, '…', {SNIPPET_TOKENS}),
+               rank
+        FROM {TABLE}
+        WHERE {TABLE} MATCH %s
+          AND kind IN ({kind_placeholders})
+          AND (owner_id IS NULL OR owner_id = %s)
+        ORDER BY rank
+        LIMIT %s OFFSET %s
+    """
+    params = [MARK_OPEN, MARK_CLOSE, MARK_OPEN, MARK_CLOSE, expression, *kinds, user_id, limit, offset]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    return [
+        {
+            "kind": kind,
+            "id": object_id,
+            "course_id": course_id,
+            "title": _marked(title),
+            "snippet": _marked(snippet),
+            "score": round(-rank, 4),
+        }
+        for kind, object_id, course_id, title, snippet, rank in rows
+    ]
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.search.index import rebuild
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from every course, lesson and resource."
+
+    def handle(self, *args, **options):
+        count = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} documents."))
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+CREATE_TABLE = """
+CREATE VIRTUAL TABLE search_document USING fts5(
+    title,
+    body,
+    kind UNINDEXED,
+    object_id UNINDEXED,
+    course_id UNINDEXED,
+    owner_id UNINDEXED,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+)
+"""
+
+# Title matches weigh eight times body matches in the default ``rank``.
+CONFIGURE_RANK = "INSERT INTO search_document (search_document, rank) VALUES ('rank', 'bm25(8.0, 1.0)')"
+
+BACKFILL = [
+    """
+    INSERT INTO search_document (rowid, title, body, kind, object_id, course_id, owner_id)
+    SELECT id * 8 + 1, title, description, 'course', id, id, NULL FROM courses_course
+    """,
+    """
+    INSERT INTO search_document (rowid, title, body, kind, object_id, course_id, owner_id)
+    SELECT id * 8 + 2, title, content, 'lesson', id, course_id, NULL FROM courses_lesson
+    """,
+    """
+    INSERT INTO search_document (rowid, title, body, kind, object_id, course_id, owner_id)
+    SELECT id * 8 + 3, title, description, 'resource', id, NULL, created_by_id FROM resources_resource
+    """,
+]
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("courses", "0002_course_course_created_idx"),
+        ("resources", "0004_alter_resource_file"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TABLE, "DROP TABLE search_document"),
+        migrations.RunSQL(CONFIGURE_RANK, migrations.RunSQL.noop),
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+    ]
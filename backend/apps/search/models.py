@@ -0,0 +1,9 @@
+from apps.courses.models import Course, Lesson
+from apps.resources.models import Resource
+
+from .fts import keep_indexed
+from .index import index_object, remove_object
+
+
+# The index itself is the FTS5 table created in migrations; it has no Django model.
+keep_indexed((Course, Lesson, Resource), index_object, remove_object)
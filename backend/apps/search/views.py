@@ -0,0 +1,32 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from .index import KINDS, search as search_index
+
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def search(request):
+    query = (request.query_params.get("q") or "").strip()
+    if not query:
+        return Response({"query": query, "results": []})
+
+    kinds = [kind.strip() for kind in (request.query_params.get("kind") or "").split(",") if kind.strip()] or KINDS
+    if not set(kinds) <= set(KINDS):
+        return Response({"error": f"kind must be one of {', '.join(KINDS)}"}, status=400)
+    try:
+        limit = min(int(request.query_params.get("limit") or DEFAULT_LIMIT), MAX_LIMIT)
+        offset = int(request.query_params.get("offset") or 0)
+    except ValueError:
+        return Response({"error": "limit and offset must be integers"}, status=400)
+    if limit < 1 or offset < 0:
+        return Response({"error": "limit must be positive and offset not negative"}, status=400)
+
+    user_id = request.user.pk if request.user.is_authenticated else None
+    results = search_index(query, user_id=user_id, kinds=kinds, limit=limit, offset=offset)
+    return Response({"query": query, "results": results})
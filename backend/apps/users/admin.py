@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Profile, ProgressSnapshot
+from .models import Profile, ProgressSnapshot, ProgressSummary
 
 
 @admin.register(Profile)
@@ -14,3 +14,9 @@ class ProgressSnapshotAdmin(admin.ModelAdmin):
     list_display = ("user", "courses_completed", "lessons_completed", "quizzes_passed", "win_rate", "created_at")
     list_filter = ("created_at",)
 
+
+@admin.register(ProgressSummary)
+class ProgressSummaryAdmin(admin.ModelAdmin):
+    list_display = ("user", "snapshot_count", "best_win_rate", "last_recorded_at")
+    search_fields = ("user__email",)
+    raw_id_fields = ("latest_snapshot",)
@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+USER_CACHE_KEY = "auth:user:{user_id}"
+
+
+def forget_user(user_id) -> None:
+    cache.delete(USER_CACHE_KEY.format(user_id=user_id))
+
+
+def forget_users(user_ids) -> None:
+    """Drop cached users after a queryset ``update()``, which sends no ``post_save``."""
+
+    cache.delete_many([USER_CACHE_KEY.format(user_id=user_id) for user_id in user_ids])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication that keeps resolved users in the cache for ``AUTH_USER_CACHE_TTL`` seconds.
+
+    Saving or deleting a user drops its entry (see ``apps.users.models``), but
+    only in the cache of the process that saved it: with the default locmem
+    ``CACHE_BACKEND`` other workers keep serving the old user, so deactivation
+    and password changes can take up to ``AUTH_USER_CACHE_TTL`` seconds to
+    apply everywhere. Set ``CACHE_BACKEND=redis`` (or the TTL to 0) where that
+    lag is not acceptable. Queryset ``update()`` calls on users send no signal
+    at all; follow them with :func:`forget_users`.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None or not settings.AUTH_USER_CACHE_TTL:
+            return super().get_user(validated_token)
+
+        key = USER_CACHE_KEY.format(user_id=user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, settings.AUTH_USER_CACHE_TTL)
+            return user
+
+        # Same checks the uncached path makes after loading the row.
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed("The user's password has been changed.", code="password_changed")
+        return user
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+from apps.blobs.storage import is_blob
+
+
+logger = logging.getLogger(__name__)
+
+RENDITION_SIZES = (64, 256, 1024)
+RENDITION_FORMATS = {
+    "webp": ("WEBP", {"quality": 82, "method": 4}),
+    "jpeg": ("JPEG", {"quality": 85, "optimize": True, "progressive": True}),
+}
+
+# Pillow releases the GIL while decoding, resampling and encoding, so threads scale here.
+_executor = ThreadPoolExecutor(max_workers=settings.AVATAR_WORKERS, thread_name_prefix="avatar")
+
+
+def rendition_name(avatar_name: str, size: int, extension: str) -> str:
+    path = Path(avatar_name)
+    return str(path.parent / "renditions" / f"{path.stem}-{size}.{extension}")
+
+
+def render_renditions(avatar_name: str, storage=default_storage) -> dict:
+    """Write every size/format rendition of ``avatar_name`` and return their storage names."""
+
+    if is_blob(avatar_name):
+        # Content-addressed avatars share renditions: another profile with the
+        # same image may already have rendered them.
+        existing = {
+            str(size): {extension: rendition_name(avatar_name, size, extension) for extension in RENDITION_FORMATS}
+            for size in RENDITION_SIZES
+        }
+        if all(storage.exists(name) for name in _names(existing)):
+            return existing
+
+    with storage.open(avatar_name, "rb") as source:
+        image = Image.open(source)
+        # For JPEGs, draft mode lets libjpeg decode at 1/2, 1/4 or 1/8 scale,
+        # never below the largest rendition, instead of the full-size image.
+        largest = max(RENDITION_SIZES)
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGB")
+
+    renditions = {}
+    # Largest first, each size downscaled from the previous one to keep resampling cheap.
+    for size in sorted(RENDITION_SIZES, reverse=True):
+        image = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+        renditions[str(size)] = {}
+        for extension, (image_format, options) in RENDITION_FORMATS.items():
+            buffer = BytesIO()
+            image.save(buffer, format=image_format, **options)
+            name = rendition_name(avatar_name, size, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            renditions[str(size)][extension] = storage.save(name, ContentFile(buffer.getvalue()))
+    return renditions
+
+
+def _names(renditions: dict) -> set[str]:
+    return {name for formats in (renditions or {}).values() for name in formats.values()}
+
+
+def delete_renditions(renditions: dict | None, keep: set[str] = frozenset(), storage=default_storage) -> None:
+    for name in _names(renditions) - keep:
+        # Renditions of a blob may be shared; collect_blobs removes them with it.
+        if not is_blob(name):
+            storage.delete(name)
+
+
+def process_avatar(profile_id: int, avatar_name: str, stale: dict | None = None) -> None:
+    """Render ``avatar_name`` and attach it, then delete the ``stale`` renditions it replaces."""
+
+    from django.db import close_old_connections
+
+    from .models import Profile
+
+    close_old_connections()
+    try:
+        renditions = render_renditions(avatar_name)
+        # Only attach the renditions if the avatar was not replaced meanwhile;
+        # otherwise they are the stale ones.
+        if Profile.objects.filter(pk=profile_id, avatar=avatar_name).update(avatar_renditions=renditions):
+            delete_renditions(stale, keep=_names(renditions))
+        else:
+            delete_renditions(renditions)
+    except Exception:  # pragma: no cover - logged, the original avatar still works
+        logger.exception("Avatar renditions failed for profile %s (%s)", profile_id, avatar_name)
+    finally:
+        close_old_connections()
+
+
+def schedule_avatar(profile_id: int, avatar_name: str, stale: dict | None = None):
+    return _executor.submit(process_avatar, profile_id, avatar_name, stale)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import LeaderboardEntry
+
+
+GLOBAL = "global"
+WEEKLY = "weekly"
+COURSE = "course"
+WINDOWS = (GLOBAL, WEEKLY, COURSE)
+METRICS = ("win_rate", "lessons_completed")
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+WEEKS_KEPT = 8
+
+TOP_KEY = "leaderboard:{board}:{metric}:{limit}"
+TOP_TIMEOUT = 30
+
+
+def week_board(moment: datetime | None = None) -> str:
+    year, week, _ = timezone.localtime(moment or timezone.now()).isocalendar()
+    return f"week:{year}-W{week:02d}"
+
+
+def course_board(course_id: int) -> str:
+    return f"course:{course_id}"
+
+
+def snapshot_boards(snapshot) -> list[str]:
+    if snapshot.course_id is not None:
+        return [course_board(snapshot.course_id)]
+    return [GLOBAL, week_board(snapshot.created_at)]
+
+
+def record_snapshot(snapshot) -> None:
+    """Upsert the snapshot's user on every board it belongs to, in one statement."""
+
+    entries = [
+        LeaderboardEntry(
+            board=board,
+            user_id=snapshot.user_id,
+            win_rate=snapshot.win_rate,
+            lessons_completed=snapshot.lessons_completed,
+            recorded_at=snapshot.created_at,
+        )
+        for board in snapshot_boards(snapshot)
+    ]
+    LeaderboardEntry.objects.bulk_create(
+        entries,
+        update_conflicts=True,
+        unique_fields=["board", "user"],
+        update_fields=["win_rate", "lessons_completed", "recorded_at"],
+    )
+
+
+def _ranked(board: str, metric: str):
+    # Ties go to whoever reached the value first.
+    return LeaderboardEntry.objects.filter(board=board).order_by(f"-{metric}", "recorded_at", "user_id")
+
+
+def top(board: str, metric: str, limit: int = DEFAULT_LIMIT) -> list[dict]:
+    """The first ``limit`` rows of a board with competition ranks (1, 2, 2, 4)."""
+
+    def build():
+        rows = _ranked(board, metric).values_list("user_id", "user__profile__nickname", "user__first_name", metric)[:limit]
+        entries, previous = [], None
+        for position, (user_id, nickname, first_name, value) in enumerate(rows, start=1):
+            rank = entries[-1]["rank"] if entries and value == previous else position
+            entries.append({"rank": rank, "user_id": user_id, "name": nickname or first_name, "value": value})
+            previous = value
+        return entries
+
+    # Short-lived: the table is always current, this only absorbs page-view bursts.
+    return cache.get_or_set(TOP_KEY.format(board=board, metric=metric, limit=limit), build, TOP_TIMEOUT)
+
+
+def standing(board: str, metric: str, user_id: int) -> dict | None:
+    """Rank and percentile of one user on a board; ``None`` if they have no entry."""
+
+    entry = LeaderboardEntry.objects.filter(board=board, user_id=user_id).values_list(metric, flat=True).first()
+    if entry is None:
+        return None
+    counts = LeaderboardEntry.objects.filter(board=board).aggregate(
+        total=Count("id"),
+        ahead=Count("id", filter=Q(**{f"{metric}__gt": entry})),
+        below=Count("id", filter=Q(**{f"{metric}__lt": entry})),
+    )
+    return {
+        "rank": counts["ahead"] + 1,
+        "value": entry,
+        "total": counts["total"],
+        # Share of the board strictly behind this user.
+        "percentile": round(100 * counts["below"] / counts["total"], 1),
+    }
+
+
+def prune_weekly_boards(weeks: int = WEEKS_KEPT) -> int:
+    keep = {week_board(timezone.now() - timedelta(weeks=offset)) for offset in range(weeks)}
+    deleted, _ = LeaderboardEntry.objects.filter(board__startswith="week:").exclude(board__in=keep).delete()
+    return deleted
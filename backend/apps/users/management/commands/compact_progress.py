@@ -0,0 +1,78 @@
+from datetime import timedelta
+from itertools import groupby
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.users.leaderboard import prune_weekly_boards
+from apps.users.models import ProgressSnapshot, ProgressSummary
+
+
+DELETE_BATCH = 500
+
+
+class Command(BaseCommand):
+    help = (
+        "Downsample old progress snapshots: keep everything recent, the last snapshot of each day "
+        "after --daily-after days and the last of each ISO week after --weekly-after days."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--daily-after", type=int, default=30)
+        parser.add_argument("--weekly-after", type=int, default=180)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        if not 0 < options["daily_after"] <= options["weekly_after"]:
+            raise CommandError("Need 0 < --daily-after <= --weekly-after.")
+
+        now = timezone.now()
+        daily_cutoff = now - timedelta(days=options["daily_after"])
+        weekly_cutoff = now - timedelta(days=options["weekly_after"])
+        # Summaries keep their running counts; only the latest snapshot must survive.
+        protected = set(ProgressSummary.objects.exclude(latest_snapshot=None).values_list("latest_snapshot_id", flat=True))
+
+        users = (
+            ProgressSnapshot.objects.filter(created_at__lt=daily_cutoff)
+            .order_by()
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
+        removed = 0
+        for user_id in users.iterator():
+            stale = self._stale_ids(user_id, daily_cutoff, weekly_cutoff) - protected
+            removed += len(stale)
+            if not options["dry_run"]:
+                self._delete(stale)
+
+        verb = "Would remove" if options["dry_run"] else "Removed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {removed} progress snapshots."))
+        if not options["dry_run"]:
+            self.stdout.write(f"Removed {prune_weekly_boards()} expired weekly leaderboard entries.")
+
+    def _stale_ids(self, user_id, daily_cutoff, weekly_cutoff):
+        rows = (
+            ProgressSnapshot.objects.filter(user_id=user_id, created_at__lt=daily_cutoff)
+            .order_by("course_id", "created_at", "id")
+            .values_list("id", "created_at", "course_id")
+        )
+
+        # Overall and per-course snapshots are thinned out separately.
+        def bucket(row):
+            _, created_at, course_id = row
+            if created_at < weekly_cutoff:
+                return (course_id, "week", *created_at.isocalendar()[:2])
+            return (course_id, "day", created_at.date())
+
+        stale = set()
+        for _, group in groupby(rows.iterator(), key=bucket):
+            ids = [row[0] for row in group]
+            stale.update(ids[:-1])
+        return stale
+
+    def _delete(self, ids):
+        ids = sorted(ids)
+        for start in range(0, len(ids), DELETE_BATCH):
+            with transaction.atomic():
+                ProgressSnapshot.objects.filter(id__in=ids[start:start + DELETE_BATCH]).delete()
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='progresssnapshot',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='progress_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_summaries(apps, schema_editor):
+    ProgressSnapshot = apps.get_model("users", "ProgressSnapshot")
+    ProgressSummary = apps.get_model("users", "ProgressSummary")
+
+    summaries = {}
+    snapshots = ProgressSnapshot.objects.order_by("user_id", "created_at", "id").iterator(chunk_size=2000)
+    for snapshot in snapshots:
+        summary = summaries.get(snapshot.user_id)
+        if summary is None:
+            summary = summaries[snapshot.user_id] = ProgressSummary(
+                user_id=snapshot.user_id, first_recorded_at=snapshot.created_at
+            )
+        previous = summary.latest_snapshot
+        if previous is not None:
+            summary.courses_delta = snapshot.courses_completed - previous.courses_completed
+            summary.lessons_delta = snapshot.lessons_completed - previous.lessons_completed
+            summary.quizzes_delta = snapshot.quizzes_passed - previous.quizzes_passed
+            summary.win_rate_delta = snapshot.win_rate - previous.win_rate
+        summary.latest_snapshot = snapshot
+        summary.snapshot_count += 1
+        summary.best_win_rate = max(summary.best_win_rate, snapshot.win_rate)
+        summary.last_recorded_at = snapshot.created_at
+    ProgressSummary.objects.bulk_create(summaries.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0003_profile_avatar_renditions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressSummary',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='progress_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('snapshot_count', models.PositiveIntegerField(default=0)),
+                ('best_win_rate', models.DecimalField(decimal_places=2, default=0, max_digits=5)),
+                ('courses_delta', models.IntegerField(default=0)),
+                ('lessons_delta', models.IntegerField(default=0)),
+                ('quizzes_delta', models.IntegerField(default=0)),
+                ('win_rate_delta', models.DecimalField(decimal_places=2, default=0, max_digits=6)),
+                ('first_recorded_at', models.DateTimeField(blank=True, null=True)),
+                ('last_recorded_at', models.DateTimeField(blank=True, null=True)),
+                ('latest_snapshot', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='users.progresssnapshot')),
+            ],
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
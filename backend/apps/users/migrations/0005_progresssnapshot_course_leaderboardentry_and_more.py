@@ -0,0 +1,59 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_leaderboards(apps, schema_editor):
+    ProgressSnapshot = apps.get_model("users", "ProgressSnapshot")
+    LeaderboardEntry = apps.get_model("users", "LeaderboardEntry")
+
+    # Only the overall board can be rebuilt: existing snapshots predate courses and weeks.
+    entries = {}
+    snapshots = ProgressSnapshot.objects.order_by("created_at", "id").iterator(chunk_size=2000)
+    for snapshot in snapshots:
+        entries[snapshot.user_id] = LeaderboardEntry(
+            board="global",
+            user_id=snapshot.user_id,
+            win_rate=snapshot.win_rate,
+            lessons_completed=snapshot.lessons_completed,
+            recorded_at=snapshot.created_at,
+        )
+    LeaderboardEntry.objects.bulk_create(entries.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_course_course_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('users', '0004_progresssummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='progresssnapshot',
+            name='course',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='progress_snapshots', to='courses.course'),
+        ),
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('board', models.CharField(max_length=32)),
+                ('win_rate', models.DecimalField(decimal_places=2, default=0, max_digits=5)),
+                ('lessons_completed', models.PositiveIntegerField(default=0)),
+                ('recorded_at', models.DateTimeField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['board', '-win_rate', 'recorded_at'], name='leaderboard_win_rate_idx'), models.Index(fields=['board', '-lessons_completed', 'recorded_at'], name='leaderboard_lessons_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='leaderboardentry',
+            constraint=models.UniqueConstraint(fields=('board', 'user'), name='leaderboard_board_user_unique'),
+        ),
+        migrations.RunPython(backfill_leaderboards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0005_progresssnapshot_course_leaderboardentry_and_more"),
+    ]
+
+    # auth.User is not ours to add Meta indexes to, so the expression index is plain SQL.
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX auth_user_email_lower_idx ON auth_user (LOWER(email));",
+            "DROP INDEX auth_user_email_lower_idx;",
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:11
+
+import apps.blobs.storage
+import apps.users.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_auth_user_email_lower_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='avatar',
+            field=models.ImageField(blank=True, null=True, storage=apps.blobs.storage.get_blob_storage, upload_to=apps.users.models.avatar_upload_path),
+        ),
+    ]
@@ -1,10 +1,15 @@
 import os
+from decimal import Decimal
 from pathlib import Path
 
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
 from django.dispatch import receiver
-from django.db.models.signals import post_save
+from django.db.models.functions import Lower
+from django.db.models.signals import post_delete, post_save
+
+from apps.blobs.models import track_blobs
+from apps.blobs.storage import get_blob_storage
 
 
 User = get_user_model()
@@ -19,15 +24,24 @@ class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile")
     nickname = models.CharField(max_length=80, blank=True)
     bio = models.TextField(blank=True)
-    avatar = models.ImageField(upload_to=avatar_upload_path, blank=True, null=True)
+    avatar = models.ImageField(upload_to=avatar_upload_path, storage=get_blob_storage, blank=True, null=True)
+    # {"64": {"webp": name, "jpeg": name}, ...}, filled in by the avatar workers.
+    avatar_renditions = models.JSONField(default=dict, blank=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self) -> str:
         return f"Profile for {self.user.email}"
 
 
+track_blobs(Profile, "avatar")
+
+
 class ProgressSnapshot(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="progress_snapshots")
+    # Set for progress within a single course; overall progress leaves it empty.
+    course = models.ForeignKey(
+        "courses.Course", on_delete=models.CASCADE, null=True, blank=True, related_name="progress_snapshots"
+    )
     courses_completed = models.PositiveIntegerField(default=0)
     lessons_completed = models.PositiveIntegerField(default=0)
     quizzes_passed = models.PositiveIntegerField(default=0)
@@ -36,11 +50,103 @@ class ProgressSnapshot(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["user", "-created_at", "-id"], name="progress_user_created_idx")]
 
     def __str__(self) -> str:
         return f"Progress for {self.user.email} @ {self.created_at:%Y-%m-%d}"
 
 
+class ProgressSummary(models.Model):
+    """Running per-user aggregate of overall ``ProgressSnapshot`` rows, one primary-key lookup to read."""
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="progress_summary")
+    latest_snapshot = models.ForeignKey(
+        ProgressSnapshot, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    snapshot_count = models.PositiveIntegerField(default=0)
+    best_win_rate = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    courses_delta = models.IntegerField(default=0)
+    lessons_delta = models.IntegerField(default=0)
+    quizzes_delta = models.IntegerField(default=0)
+    win_rate_delta = models.DecimalField(max_digits=6, decimal_places=2, default=0)
+    first_recorded_at = models.DateTimeField(null=True, blank=True)
+    last_recorded_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"Progress summary for {self.user.email}"
+
+    def apply(self, snapshot: ProgressSnapshot) -> None:
+        """Fold a newly recorded snapshot into the aggregate (deltas are against the previous one)."""
+
+        previous = self.latest_snapshot
+        if previous is not None:
+            self.courses_delta = snapshot.courses_completed - previous.courses_completed
+            self.lessons_delta = snapshot.lessons_completed - previous.lessons_completed
+            self.quizzes_delta = snapshot.quizzes_passed - previous.quizzes_passed
+            self.win_rate_delta = Decimal(snapshot.win_rate) - previous.win_rate
+        self.latest_snapshot = snapshot
+        self.snapshot_count += 1
+        self.best_win_rate = max(self.best_win_rate, Decimal(snapshot.win_rate))
+        self.first_recorded_at = self.first_recorded_at or snapshot.created_at
+        self.last_recorded_at = snapshot.created_at
+
+
+class LeaderboardEntry(models.Model):
+    """Materialised ranking row: a user's latest standing on one board.
+
+    Boards are ``global``, ``week:<iso year>-W<week>`` and ``course:<id>``
+    (see ``apps.users.leaderboard``); rows are upserted on every snapshot insert.
+    """
+
+    board = models.CharField(max_length=32)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="leaderboard_entries")
+    win_rate = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    lessons_completed = models.PositiveIntegerField(default=0)
+    recorded_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["board", "user"], name="leaderboard_board_user_unique")]
+        indexes = [
+            models.Index(fields=["board", "-win_rate", "recorded_at"], name="leaderboard_win_rate_idx"),
+            models.Index(fields=["board", "-lessons_completed", "recorded_at"], name="leaderboard_lessons_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.board} • {self.user.email}"
+
+
+@receiver(post_save, sender=ProgressSnapshot)
+def update_progress_summary(sender, instance, created, **kwargs):
+    if not created or instance.course_id is not None:
+        return
+    with transaction.atomic():
+        # The row lock serialises concurrent snapshots of the same user.
+        summary, _ = ProgressSummary.objects.select_for_update().get_or_create(user_id=instance.user_id)
+        summary.apply(instance)
+        summary.save()
+
+
+@receiver(post_save, sender=ProgressSnapshot)
+def update_leaderboards(sender, instance, created, **kwargs):
+    from .leaderboard import record_snapshot
+
+    if created:
+        record_snapshot(instance)
+
+
+def users_with_email(email: str):
+    """Case-insensitive email match that can use the ``LOWER(email)`` index."""
+
+    return User.objects.alias(email_lower=Lower("email")).filter(email_lower=email.lower())
+
+
+@receiver([post_save, post_delete], sender=User)
+def forget_cached_user(sender, instance, **kwargs):
+    from .authentication import forget_user
+
+    forget_user(instance.pk)
+
+
 @receiver(post_save, sender=User)
 def ensure_profile_exists(sender, instance, created, **kwargs):
     if created:
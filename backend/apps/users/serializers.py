@@ -1,64 +1,55 @@
-from io import BytesIO
-
-from django.core.files.uploadedfile import InMemoryUploadedFile
-from PIL import Image
+from django.db import transaction
 from rest_framework import serializers
 
-from .models import Profile, ProgressSnapshot
+from mngfx_backend.serializers import SparseFieldsetMixin
+
+from .avatars import delete_renditions, schedule_avatar
+from .models import Profile, ProgressSnapshot, ProgressSummary
 
 
 class ProfileSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(source="user.email", read_only=True)
+    avatar_renditions = serializers.SerializerMethodField()
 
     class Meta:
         model = Profile
-        fields = ["email", "nickname", "bio", "avatar"]
-
-    def _compress_avatar(self, avatar):
-        max_size_bytes = 10 * 1024 * 1024
-        if avatar.size <= max_size_bytes:
-            return avatar
+        fields = ["email", "nickname", "bio", "avatar", "avatar_renditions"]
 
-        image = Image.open(avatar)
-        image_format = image.format or "JPEG"
-
-        max_dimension = 1024
-        image.thumbnail((max_dimension, max_dimension))
-
-        buffer = BytesIO()
-        save_kwargs = {"optimize": True}
-        if image_format.upper() in {"JPEG", "JPG"}:
-            save_kwargs["format"] = "JPEG"
-            save_kwargs["quality"] = 85
-        else:
-            save_kwargs["format"] = image_format
+    def get_avatar_renditions(self, profile):
+        storage = profile.avatar.storage
+        request = self.context.get("request")
 
-        image.save(buffer, **save_kwargs)
-        buffer.seek(0)
+        def url(name):
+            # Absolute like the avatar field itself when a request is available.
+            return request.build_absolute_uri(storage.url(name)) if request else storage.url(name)
 
-        compressed = InMemoryUploadedFile(
-            buffer,
-            field_name="avatar",
-            name=avatar.name or "avatar.jpg",
-            content_type=avatar.content_type or "image/jpeg",
-            size=buffer.getbuffer().nbytes,
-            charset=None,
-        )
-        return compressed
+        return {
+            size: {extension: url(name) for extension, name in formats.items()}
+            for size, formats in profile.avatar_renditions.items()
+        }
 
     def update(self, instance, validated_data):
-        avatar = validated_data.get("avatar")
-        if avatar:
-            avatar = self._compress_avatar(avatar)
-            validated_data["avatar"] = avatar
-        return super().update(instance, validated_data)
+        # The upload is stored as sent; thumbnails are rendered by the avatar
+        # workers after the transaction commits and appear in avatar_renditions.
+        if "avatar" not in validated_data:
+            return super().update(instance, validated_data)
+
+        stale = instance.avatar_renditions
+        validated_data["avatar_renditions"] = {}
+        profile = super().update(instance, validated_data)
+        if profile.avatar:
+            transaction.on_commit(lambda: schedule_avatar(profile.pk, profile.avatar.name, stale))
+        else:
+            transaction.on_commit(lambda: delete_renditions(stale))
+        return profile
 
 
-class ProgressSnapshotSerializer(serializers.ModelSerializer):
+class ProgressSnapshotSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = ProgressSnapshot
         fields = [
             "id",
+            "course",
             "courses_completed",
             "lessons_completed",
             "quizzes_passed",
@@ -66,3 +57,17 @@ class ProgressSnapshotSerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
+
+class ProgressSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProgressSummary
+        fields = [
+            "snapshot_count",
+            "best_win_rate",
+            "courses_delta",
+            "lessons_delta",
+            "quizzes_delta",
+            "win_rate_delta",
+            "first_recorded_at",
+            "last_recorded_at",
+        ]
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from .views import (
+    LeaderboardView,
     ProfileView,
     ProgressSnapshotView,
     ProgressSummaryView,
@@ -17,5 +18,6 @@ urlpatterns = [
     path("profile/", ProfileView.as_view(), name="profile"),
     path("progress/", ProgressSnapshotView.as_view(), name="progress"),
     path("progress/summary/", ProgressSummaryView.as_view(), name="progress-summary"),
+    path("leaderboard/", LeaderboardView.as_view(), name="leaderboard"),
 ]
 
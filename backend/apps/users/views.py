@@ -1,6 +1,7 @@
 from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.parsers import FormParser, MultiPartParser
@@ -8,8 +9,9 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .models import Profile, ProgressSnapshot
-from .serializers import ProfileSerializer, ProgressSnapshotSerializer
+from . import leaderboard
+from .models import Profile, ProgressSnapshot, ProgressSummary, users_with_email
+from .serializers import ProfileSerializer, ProgressSnapshotSerializer, ProgressSummarySerializer
 
 User = get_user_model()
 
@@ -39,7 +41,7 @@ def register(request):
     if not email or not password or not first_name or not last_name:
         return Response({"error": "first_name, last_name, email and password are required"}, status=400)
 
-    if User.objects.filter(email__iexact=email).exists():
+    if users_with_email(email).exists():
         return Response({"error": "An account with this email already exists."}, status=400)
 
     try:
@@ -139,7 +141,9 @@ class ProgressSnapshotView(generics.ListCreateAPIView):
         return ProgressSnapshot.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        # The snapshot and the summary row it updates commit together.
+        with transaction.atomic():
+            serializer.save(user=self.request.user)
 
 
 class ProgressSummaryView(generics.GenericAPIView):
@@ -147,13 +151,56 @@ class ProgressSummaryView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
-        latest = request.user.progress_snapshots.order_by("-created_at").first()
-        history = request.user.progress_snapshots.order_by("-created_at")[:10]
+        summary = ProgressSummary.objects.select_related("latest_snapshot").filter(user=request.user).first()
+        latest = summary.latest_snapshot if summary else None
+        history = request.user.progress_snapshots.filter(course=None).order_by("-created_at", "-id")[:10]
         return Response(
             {
                 "latest": ProgressSnapshotSerializer(latest).data if latest else None,
                 "history": ProgressSnapshotSerializer(history, many=True).data,
+                "summary": ProgressSummarySerializer(summary).data if summary else None,
             },
             status=status.HTTP_200_OK,
         )
 
+
+class LeaderboardView(generics.GenericAPIView):
+    """Top of a leaderboard plus the caller's own rank and percentile.
+
+    ``?window=global|weekly|course`` (``course`` needs ``?course=<id>``),
+    ``?metric=win_rate|lessons_completed`` and ``?limit=`` (max 100).
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        window = request.query_params.get("window") or leaderboard.GLOBAL
+        metric = request.query_params.get("metric") or leaderboard.METRICS[0]
+        if window not in leaderboard.WINDOWS:
+            return Response({"error": f"window must be one of {', '.join(leaderboard.WINDOWS)}"}, status=400)
+        if metric not in leaderboard.METRICS:
+            return Response({"error": f"metric must be one of {', '.join(leaderboard.METRICS)}"}, status=400)
+        try:
+            limit = int(request.query_params.get("limit") or leaderboard.DEFAULT_LIMIT)
+        except ValueError:
+            return Response({"error": "limit must be a number"}, status=400)
+        limit = max(1, min(limit, leaderboard.MAX_LIMIT))
+
+        if window == leaderboard.COURSE:
+            course = request.query_params.get("course") or ""
+            if not course.isdigit():
+                return Response({"error": "course id required for the course window"}, status=400)
+            board = leaderboard.course_board(int(course))
+        elif window == leaderboard.WEEKLY:
+            board = leaderboard.week_board()
+        else:
+            board = leaderboard.GLOBAL
+
+        return Response(
+            {
+                "board": board,
+                "metric": metric,
+                "entries": leaderboard.top(board, metric, limit),
+                "me": leaderboard.standing(board, metric, request.user.pk),
+            }
+        )
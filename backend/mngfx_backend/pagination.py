@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """Keyset pagination over ``(-created_at, -id)``, newest first.
+
+    Every page is an index range scan from the cursor, so cost stays flat however
+    deep a client pages. Models listed through it carry a matching index.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
@@ -0,0 +1,20 @@
+from rest_framework.permissions import SAFE_METHODS
+
+
+class SparseFieldsetMixin:
+    """Trims a serializer to the comma separated ``?fields=`` of a read request.
+
+    Unknown names are ignored; writes always use the full field set.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return
+        requested = request.query_params.get("fields")
+        if not requested:
+            return
+        keep = {name.strip() for name in requested.split(",")}
+        for name in set(self.fields) - keep:
+            self.fields.pop(name)
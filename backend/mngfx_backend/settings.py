@@ -2,6 +2,7 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
 
@@ -40,6 +41,8 @@ INSTALLED_APPS = [
     "apps.resources",
     "apps.feedback",
     "apps.browser",
+    "apps.blobs",
+    "apps.search",
 ]
 
 
@@ -113,7 +116,59 @@ else:
     }
 
 
+def _redis_cache(db: str) -> dict:
+    return {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://{}:{}/{}".format(
+            os.getenv("REDIS_HOST", "127.0.0.1"),
+            os.getenv("REDIS_PORT", "6379"),
+            db,
+        ),
+    }
+
+
+# REST-side caches (JWT users, catalogue, feedback summary) are per-process
+# unless CACHE_BACKEND=redis, so plain API calls never depend on Redis.
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem").lower()
+# Market feed subscriber counts, symbol ids and shared snapshots must be seen by
+# every worker, so that cache follows the channel layer instead.
+MARKETDATA_CACHE = "marketdata"
+CACHES = {
+    "default": (
+        _redis_cache(os.getenv("REDIS_CACHE_DB", "1"))
+        if CACHE_BACKEND == "redis"
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "default"}
+    ),
+    MARKETDATA_CACHE: (
+        {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "marketdata"}
+        if CHANNEL_LAYER_BACKEND == "inmemory"
+        else _redis_cache(os.getenv("REDIS_MARKETDATA_DB", "2"))
+    ),
+}
+
+
+MARKETDATA_SYMBOLS = [
+    symbol.strip().upper()
+    for symbol in os.getenv("MARKETDATA_SYMBOLS", "EURUSD,GBPUSD,USDJPY,AUDUSD,USDCAD,USDCHF,NZDUSD,XAUUSD").split(",")
+    if symbol.strip()
+]
+MARKETDATA_TICK_DIR = Path(os.getenv("MARKETDATA_TICK_DIR", str(BASE_DIR / "data" / "ticks")))
+MARKETDATA_SHARED_SNAPSHOTS = os.getenv("MARKETDATA_SHARED_SNAPSHOTS", "True") == "True"
+
+# Queue public feedback submissions in memory and insert them in batches.
+FEEDBACK_WRITE_BEHIND = os.getenv("FEEDBACK_WRITE_BEHIND", "False") == "True"
+
+
 AUTH_PASSWORD_VALIDATORS = []
+# PBKDF2 iterations for new and re-encoded hashes; unset means Django's default.
+PASSWORD_HASH_ITERATIONS = int(os.getenv("PASSWORD_HASH_ITERATIONS", "0")) or None
+PASSWORD_HASHERS = [
+    "apps.users.hashers.ConfigurablePBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
 
 
 LANGUAGE_CODE = "en-us"
@@ -130,7 +185,19 @@ STATICFILES_DIRS = [
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 DATA_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv("DATA_UPLOAD_MAX_MEMORY_SIZE", str(20 * 1024 * 1024)))
-FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv("FILE_UPLOAD_MAX_MEMORY_SIZE", str(20 * 1024 * 1024)))
+# Larger multipart files spool to a temporary file instead of worker memory.
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv("FILE_UPLOAD_MAX_MEMORY_SIZE", str(2_621_440)))
+# Chunked resource uploads: where partial files live, the largest file and the largest chunk.
+RESOURCE_UPLOAD_DIR = Path(os.getenv("RESOURCE_UPLOAD_DIR", str(BASE_DIR / "data" / "uploads")))
+RESOURCE_UPLOAD_MAX_SIZE = int(os.getenv("RESOURCE_UPLOAD_MAX_SIZE", str(2 * 1024 * 1024 * 1024)))
+RESOURCE_UPLOAD_CHUNK_SIZE = int(os.getenv("RESOURCE_UPLOAD_CHUNK_SIZE", str(8 * 1024 * 1024)))
+# Threads rendering avatar thumbnails outside the request.
+AVATAR_WORKERS = int(os.getenv("AVATAR_WORKERS", "2"))
+# Let the front server send resource downloads (recommended in production):
+# "" streams them from Django in blocks, "nginx" uses X-Accel-Redirect to
+# RESOURCE_ACCEL_PREFIX (an internal alias of MEDIA_ROOT), "apache" uses X-Sendfile.
+RESOURCE_SENDFILE = os.getenv("RESOURCE_SENDFILE", "").lower()
+RESOURCE_ACCEL_PREFIX = os.getenv("RESOURCE_ACCEL_PREFIX", "/protected-media/")
 
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -138,11 +205,12 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_PAGINATION_CLASS": "mngfx_backend.pagination.CreatedAtCursorPagination",
 }
 
 
@@ -150,6 +218,10 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
 }
+# Seconds a token's user stays cached between requests; 0 loads it every time.
+# Without a shared CACHE_BACKEND, deactivations and password changes made in
+# another process can take this long to be noticed.
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "60"))
 
 
 CORS_ALLOW_ALL_ORIGINS = False
@@ -159,6 +231,8 @@ CORS_ALLOWED_ORIGINS = [
     if origin
 ]
 CORS_ALLOW_CREDENTIALS = True
+# Chunked uploads send their position in an Upload-Offset header.
+CORS_ALLOW_HEADERS = (*default_headers, "upload-offset")
 
 
 CSRF_TRUSTED_ORIGINS = [
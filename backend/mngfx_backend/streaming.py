@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+
+
+_DONE = object()
+
+
+async def _aiterate(iterable):
+    # Each step runs on the request's sync thread, so a queryset iterator keeps
+    # its database connection and open files are only touched from one thread.
+    iterator = iter(iterable)
+    advance = sync_to_async(next, thread_sensitive=True)
+    try:
+        while True:
+            item = await advance(iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=True)()
+
+
+def streaming_content(request, iterable):
+    """Content for a ``StreamingHttpResponse`` that is streamed under WSGI and ASGI alike.
+
+    Under ASGI, Django 4.2 consumes a synchronous iterator with ``list()``
+    before sending anything, so it is wrapped in an async iterator that pulls
+    one chunk at a time. Under WSGI the plain iterator is already streamed (and
+    an async one would be buffered instead), so it is returned unchanged.
+    """
+
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        return _aiterate(iterable)
+    return iterable
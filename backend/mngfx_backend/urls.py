@@ -12,6 +12,8 @@ urlpatterns = [
     path("api/resources/", include("apps.resources.urls")),
     path("api/feedback/", include("apps.feedback.urls")),
     path("api/browser/", include("apps.browser.urls")),
+    path("api/market/", include("apps.marketdata.urls")),
+    path("api/search/", include("apps.search.urls")),
 ]
 
 if settings.DEBUG:
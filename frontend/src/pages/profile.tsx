@@ -12,8 +12,11 @@ type ProfileResponse = {
   nickname: string;
   bio: string;
   avatar?: string | null;
+  avatar_renditions?: Record<string, { webp: string; jpeg: string }>;
 };
 
+const mediaUrl = (url: string) => (url.startsWith('http') ? url : `${apiBase}${url}`);
+
 const ProfilePage = () => {
   const status = useRequireAuth();
   const { data: session, update } = useSession();
@@ -130,7 +133,8 @@ const ProfilePage = () => {
     return null;
   }
 
-  const avatarSrc = profile.avatar ? `${apiBase}${profile.avatar}` : null;
+  const avatarRendition = profile.avatar_renditions?.['256'];
+  const avatarSrc = profile.avatar ? mediaUrl(avatarRendition?.jpeg || profile.avatar) : null;
 
   return (
     <>
@@ -157,7 +161,10 @@ const ProfilePage = () => {
               }}
             >
               {avatarSrc ? (
-                <img src={avatarSrc} alt="Avatar" width={140} height={140} style={{ objectFit: 'cover' }} />
+                <picture>
+                  {avatarRendition && <source srcSet={mediaUrl(avatarRendition.webp)} type="image/webp" />}
+                  <img src={avatarSrc} alt="Avatar" width={140} height={140} style={{ objectFit: 'cover' }} />
+                </picture>
               ) : (
                 <span style={{ fontSize: '2rem', color: '#64748b' }}>
                   {session?.user?.name?.slice(0, 2).toUpperCase() || 'FX'}
@@ -5,6 +5,9 @@ import { useSession } from 'next-auth/react';
 import { useRequireAuth } from '@/hooks/useRequireAuth';
 
 const apiBase = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+const CHUNK_SIZE = 4 * 1024 * 1024;
+const MAX_CHUNK_RETRIES = 5;
+const RESOURCE_PAGE_SIZE = 200;
 
 type Resource = {
   id: number;
@@ -30,14 +33,21 @@ const ResourcesPage = () => {
     if (!token) return;
     setLoading(true);
     try {
-      const response = await fetch(`${apiBase}/api/resources/`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      if (!response.ok) {
-        throw new Error('Unable to load resources');
+      // The list is cursor-paginated; follow `next` until every page is loaded.
+      const loaded: Resource[] = [];
+      let url: string | null = `${apiBase}/api/resources/?page_size=${RESOURCE_PAGE_SIZE}`;
+      while (url) {
+        const response: Response = await fetch(url, {
+          headers: { Authorization: `Bearer ${token}` },
+        });
+        if (!response.ok) {
+          throw new Error('Unable to load resources');
+        }
+        const data: { next: string | null; results: Resource[] } = await response.json();
+        loaded.push(...data.results);
+        url = data.next;
       }
-      const data = await response.json();
-      setResources(data);
+      setResources(loaded);
     } catch (error) {
       console.error(error);
     } finally {
@@ -52,22 +62,75 @@ const ResourcesPage = () => {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [status, token]);
 
+  const uploadInChunks = async (file: File) => {
+    const headers = { Authorization: `Bearer ${token}` };
+    const created = await fetch(`${apiBase}/api/resources/uploads/`, {
+      method: 'POST',
+      headers: { ...headers, 'Content-Type': 'application/json' },
+      body: JSON.stringify({ filename: file.name, size: file.size }),
+    });
+    if (!created.ok) {
+      throw new Error('Upload failed');
+    }
+    const { id } = await created.json();
+    const uploadUrl = `${apiBase}/api/resources/uploads/${id}/`;
+
+    let offset = 0;
+    let retries = 0;
+    while (offset < file.size) {
+      try {
+        const response = await fetch(uploadUrl, {
+          method: 'PUT',
+          headers: {
+            ...headers,
+            'Content-Type': 'application/offset+octet-stream',
+            'Upload-Offset': String(offset),
+          },
+          body: file.slice(offset, offset + CHUNK_SIZE),
+        });
+        if (!response.ok) {
+          throw new Error('Chunk upload failed');
+        }
+        offset = (await response.json()).offset;
+        retries = 0;
+      } catch (error) {
+        retries += 1;
+        if (retries > MAX_CHUNK_RETRIES) {
+          throw error;
+        }
+        // Resume from whatever the server actually stored.
+        await new Promise((resolve) => setTimeout(resolve, 1000 * retries));
+        const stored = await fetch(uploadUrl, { headers }).catch(() => null);
+        if (stored?.ok) {
+          offset = (await stored.json()).offset;
+        }
+      }
+    }
+    return uploadUrl;
+  };
+
   const handleDocumentUpload = async (event: React.FormEvent<HTMLFormElement>) => {
     event.preventDefault();
     if (!token) return;
-    const formData = new FormData(event.currentTarget);
-    formData.append('resource_type', 'document');
+    const form = event.currentTarget;
+    const formData = new FormData(form);
+    const file = formData.get('file') as File;
     setUploading(true);
     try {
-      const response = await fetch(`${apiBase}/api/resources/`, {
+      const uploadUrl = await uploadInChunks(file);
+      const response = await fetch(`${uploadUrl}finalize/`, {
         method: 'POST',
-        headers: { Authorization: `Bearer ${token}` },
-        body: formData,
+        headers: { Authorization: `Bearer ${token}`, 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+          title: formData.get('title'),
+          description: formData.get('description'),
+          resource_type: 'document',
+        }),
       });
       if (!response.ok) {
         throw new Error('Upload failed');
       }
-      event.currentTarget.reset();
+      form.reset();
       await fetchResources();
     } catch (error) {
       console.error(error);